@@ -501,12 +501,8 @@ def _ensure_gitignored(path: "Path") -> None:
 
 def _hash_single_file(file_path) -> str:
     """Compute MD5 hash of a single file."""
-    import hashlib
-    md5 = hashlib.md5()  # noqa: S324
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            md5.update(chunk)
-    return md5.hexdigest()
+    from dvx.run.hash import _hash_file
+    return _hash_file(file_path)
 
 
 def cache_blob(file_path, md5: str, force: bool = False):
@@ -3,6 +3,7 @@
 Build and display dependency graphs from .dvc files with meta.computation.deps.
 """
 
+import heapq
 import json
 import os
 from collections import defaultdict
@@ -78,23 +79,26 @@ class DependencyGraph:
 
     def topological_sort(self) -> list[str]:
         """Return nodes in topological order (deps before dependents)."""
+        # Only deps that are themselves nodes count; ``self.nodes`` is the
+        # path index, so each check is O(1) rather than a per-node set rebuild
         in_degree = defaultdict(int)
         for path in self.nodes:
-            in_degree[path] = len(self.reverse_edges.get(path, set()) & set(self.nodes.keys()))
+            in_degree[path] = sum(1 for dep in self.reverse_edges.get(path, ()) if dep in self.nodes)
 
-        # Start with roots (in_degree == 0)
+        # Kahn's algorithm, starting with roots (in_degree == 0). A heap hands
+        # out the smallest ready path first (deterministic ordering).
         queue = [p for p, d in in_degree.items() if d == 0]
+        heapq.heapify(queue)
         result = []
 
         while queue:
-            queue.sort()  # Deterministic ordering
-            node = queue.pop(0)
+            node = heapq.heappop(queue)
             result.append(node)
             for dependent in self.edges.get(node, []):
                 if dependent in self.nodes:
                     in_degree[dependent] -= 1
                     if in_degree[dependent] == 0:
-                        queue.append(dependent)
+                        heapq.heappush(queue, dependent)
 
         return result
 
@@ -3,6 +3,7 @@
 from dvx.run.artifact import Artifact, Computation, delayed, materialize, write_all_dvc
 from dvx.run.dvc_files import (
     DVCFileInfo,
+    clear_dvc_file_cache,
     find_parent_dvc_dir,
     get_dvc_file_path,
     get_file_hash_from_dir,
@@ -11,6 +12,7 @@ from dvx.run.dvc_files import (
     get_git_head_sha,
     get_git_object_sha,
     has_file_changed_since,
+    invalidate_git_cache,
     is_output_fresh,
     read_dir_manifest,
     read_dvc_file,
@@ -27,6 +29,7 @@ __all__ = [
     "write_all_dvc",
     # DVC file handling
     "DVCFileInfo",
+    "clear_dvc_file_cache",
     "find_parent_dvc_dir",
     "get_dvc_file_path",
     "get_file_hash_from_dir",
@@ -35,6 +38,7 @@ __all__ = [
     "get_git_head_sha",
     "get_git_object_sha",
     "has_file_changed_since",
+    "invalidate_git_cache",
     "is_output_fresh",
     "read_dir_manifest",
     "read_dvc_file",
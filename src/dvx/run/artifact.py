@@ -42,7 +42,9 @@ The `delayed` decorator enables lazy function composition:
 from __future__ import annotations
 
 import functools
-from collections.abc import Callable
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, TypeVar
@@ -56,7 +58,7 @@ from dvx.run.dvc_files import (
     read_dvc_file,
     write_dvc_file,
 )
-from dvx.run.hash import compute_file_size, compute_md5
+from dvx.run.hash import compute_md5_many, compute_path_stats
 
 if TYPE_CHECKING:
     from typing import Any
@@ -100,20 +102,28 @@ class Computation:
         Returns:
             Dict mapping path strings to MD5 hashes
         """
-        hashes = {}
+        hashes: dict[str, str | None] = {}
+        # Deps to hash from disk; their keys hold a placeholder so the result
+        # keeps dep order once they're filled in
+        to_hash: list[Path] = []
         for dep in self.deps:
             if isinstance(dep, Artifact):
                 path = Path(dep.path)
                 if not recompute and dep.md5:
                     hashes[str(path)] = dep.md5
                 elif path.exists():
-                    hashes[str(path)] = compute_md5(path)
+                    hashes[str(path)] = None
+                    to_hash.append(path)
                 elif dep.md5:
                     hashes[str(path)] = dep.md5
             else:
                 path = Path(dep)
                 if path.exists():
-                    hashes[str(path)] = compute_md5(path)
+                    hashes[str(path)] = None
+                    to_hash.append(path)
+        for path, md5 in zip(to_hash, compute_md5_many(to_hash), strict=True):
+            if hashes[str(path)] is None:  # unless a later dep recorded one
+                hashes[str(path)] = md5
         return hashes
 
     def get_git_dep_hashes(self, recompute: bool = False) -> dict[str, str]:
@@ -188,11 +198,8 @@ class Artifact:
         if not p.exists():
             raise FileNotFoundError(f"Artifact not found: {path}")
 
-        return cls(
-            path=str(path),
-            md5=compute_md5(p),
-            size=compute_file_size(p),
-        )
+        stats = compute_path_stats(p)
+        return cls(path=str(path), md5=stats.md5, size=stats.size)
 
     @classmethod
     def from_dvc(cls, path: str | Path) -> Artifact | None:
@@ -265,8 +272,8 @@ class Artifact:
         md5 = self.md5
         size = self.size
         if md5 is None and path.exists():
-            md5 = compute_md5(path)
-            size = compute_file_size(path)
+            stats = compute_path_stats(path)
+            md5, size = stats.md5, stats.size
 
         # If still no hash, leave as None - write_dvc_file will omit these fields
         # to signal output doesn't exist yet (placeholder for prep phase)
@@ -308,7 +315,7 @@ class Artifact:
         return [d for d in self.computation.deps if isinstance(d, Artifact)]
 
     def walk_upstream(self, prune_fresh: bool = True) -> list[Artifact]:
-        """Recursively collect all upstream Artifacts.
+        """Collect this Artifact and everything upstream of it.
 
         Returns artifacts in dependency order (leaves first).
 
@@ -321,23 +328,29 @@ class Artifact:
 
         visited = set()
         result = []
+        # Iterative post-order DFS (deep chains would hit the recursion limit):
+        # each frame is an artifact and an iterator over its remaining upstreams
+        stack: list[tuple[Artifact, Iterator[Artifact]]] = []
 
-        def visit(artifact: Artifact):
-            if artifact.path in visited:
-                return
+        def enter(artifact: Artifact):
             visited.add(artifact.path)
-
             if prune_fresh and artifact.computation:
                 fresh, _ = is_output_fresh(Path(artifact.path))
                 if fresh:
                     result.append(artifact)
                     return
-
-            for upstream in artifact.get_upstream():
-                visit(upstream)
-            result.append(artifact)
-
-        visit(self)
+            stack.append((artifact, iter(artifact.get_upstream())))
+
+        enter(self)
+        while stack:
+            artifact, upstreams = stack[-1]
+            for upstream in upstreams:
+                if upstream.path not in visited:
+                    enter(upstream)
+                    break
+            else:
+                stack.pop()
+                result.append(artifact)
         return result
 
     def __hash__(self):
@@ -386,6 +399,14 @@ def delayed(fn: F) -> F:
     return wrapper  # type: ignore
 
 
+# Cap on write_all_dvc's concurrent writes. Each write may itself hash a large
+# output or dep set on its own pool (up to cpu_count threads, see
+# dvx.run.hash._map_hashes), so this bounds the nested total at ~4x cpu_count.
+# The writes don't share a pool with that hashing: a write blocked on hashes
+# queued behind other writes could deadlock it.
+_WRITE_DVC_MAX_WORKERS = 4
+
+
 def write_all_dvc(artifacts: list[Artifact]) -> list[Path]:
     """Write .dvc files for all artifacts in dependency order.
 
@@ -407,9 +428,16 @@ def write_all_dvc(artifacts: list[Artifact]) -> list[Path]:
                 seen.add(a.path)
                 all_artifacts.append(a)
 
-    # Write .dvc files in dependency order (leaves first)
-    # Only write computed artifacts
-    return [artifact.write_dvc() for artifact in all_artifacts if artifact.computation]
+    # Only write computed artifacts. Each write hashes from disk (or uses
+    # recorded hashes), never an upstream's .dvc file, so writes are
+    # independent; results keep dependency order (leaves first).
+    to_write = [artifact for artifact in all_artifacts if artifact.computation]
+    workers = min(_WRITE_DVC_MAX_WORKERS, os.cpu_count() or 1, len(to_write))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Call through each instance, so subclass overrides of write_dvc apply
+            return list(executor.map(lambda a: a.write_dvc(), to_write))
+    return [artifact.write_dvc() for artifact in to_write]
 
 
 def _run_one_artifact(
@@ -453,8 +481,8 @@ def _run_one_artifact(
 
     # Update artifact with computed hash and optionally write .dvc file
     if path.exists():
-        artifact.md5 = compute_md5(path)
-        artifact.size = compute_file_size(path)
+        stats = compute_path_stats(path)
+        artifact.md5, artifact.size = stats.md5, stats.size
         if update_dvc:
             artifact.write_dvc()
 
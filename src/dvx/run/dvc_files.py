@@ -26,16 +26,32 @@ Note: Computation info is stored in `meta.computation` for DVC compatibility
 (DVC allows arbitrary data in `meta`, but rejects unknown top-level keys).
 """
 
+import functools
+import json
 import os
+import re
+import stat
 import subprocess
-from dataclasses import dataclass, field
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import yaml
 
-from dvx.run.hash import compute_md5
+from dvx.run.hash import MTIME_MIN_AGE_NS, compute_md5, compute_md5_cached, compute_md5_many
+from dvx.run.status import find_status_db, get_artifact_hash_cached
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# libyaml-backed loader is ~5x faster; bind once rather than per call.
+# PyYAML built without libyaml silently falls back to the pure-Python class.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 # Simple schedule name → interval mapping
 _SCHEDULE_INTERVALS: dict[str, timedelta] = {
@@ -93,10 +109,6 @@ def is_fetch_due(schedule: str, last_run: str | None, now: datetime | None = Non
     return now >= next_fire
 
 
-# Cache for git blob SHAs (keyed by (repo_path, ref))
-_blob_cache: dict[tuple[str | None, str], dict[str, str]] = {}
-
-
 def _resolve_dep_paths(deps: dict[str, str], dvc_dir: Path) -> dict[str, str]:
     """Resolve dep paths relative to a .dvc file's directory.
 
@@ -159,36 +171,72 @@ def _relativize_dep_paths(deps: dict[str, str], dvc_dir: Path) -> dict[str, str]
     return result
 
 
-def _get_blob_cache(ref: str = "HEAD", repo_path: Path | None = None) -> dict[str, str]:
-    """Get or build the blob SHA cache for a git ref.
+def _repo_key(repo_path: Path | None) -> str:
+    """Normalize ``repo_path`` to a hashable cache key.
 
-    Uses `git ls-tree -r` to get all blob SHAs in one call, which is
-    ~50x faster than individual `git rev-parse` calls per file.
+    ``None`` means "the current directory"; resolve it eagerly so cached git
+    lookups from different working directories don't collide.
     """
-    cache_key = (str(repo_path) if repo_path else None, ref)
-    if cache_key in _blob_cache:
-        return _blob_cache[cache_key]
+    return os.fspath(repo_path) if repo_path is not None else os.getcwd()
 
-    blob_map = {}
+
+def _resolve_commit(ref: str, repo_key: str) -> str | None:
+    """Resolve ``ref`` to a full commit SHA, or None if it doesn't name one.
+
+    Not memoized: refs like ``HEAD`` or branch names move whenever a stage
+    commits, checks out or rebases. Full SHAs are returned as-is.
+    """
+    if re.fullmatch(r"[0-9a-fA-F]{40}", ref):
+        return ref.lower()
     try:
         result = subprocess.run(
-            ["git", "ls-tree", "-r", "--format=%(objectname) %(path)", ref],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            cwd=repo_key,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                sha, path = line.split(' ', 1)
-                blob_map[path] = sha
+        return result.stdout.strip().decode("ascii")
     except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
+        return None
 
-    _blob_cache[cache_key] = blob_map
+
+@functools.lru_cache(maxsize=64)
+def _list_tree(commit: str, repo_key: str) -> dict[str, str]:
+    """Get the ``{path: blob_sha}`` map for every file at a commit.
+
+    Uses one `git ls-tree -r` per commit, which is ~50x faster than individual
+    `git rev-parse` calls per file. Keyed on the commit SHA, so entries never
+    go stale. Paths are repo-root-relative (``--full-tree``) and NUL-delimited
+    (``-z``), so odd filenames aren't quoted or split. Raises if git fails, so
+    failed listings aren't memoized.
+    """
+    result = subprocess.run(
+        ["git", "ls-tree", "-r", "-z", "--full-tree", commit],
+        cwd=repo_key,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    blob_map = {}
+    for record in result.stdout.decode(errors="surrogateescape").split("\0"):
+        if record:
+            # "<mode> <type> <object>\t<path>"
+            meta, path = record.split("\t", 1)
+            blob_map[path] = meta.rsplit(" ", 1)[1]
     return blob_map
 
 
+def invalidate_git_cache() -> None:
+    """Drop all memoized git tree listings.
+
+    Listings are keyed on commit SHAs and never go stale; this only frees
+    their memory (e.g. after a ``git commit`` makes the old HEAD's tree
+    unlikely to be read again).
+    """
+    _list_tree.cache_clear()
+
+
 def get_git_head_sha(repo_path: Path | None = None) -> str | None:
     """Get the current HEAD commit SHA.
 
@@ -198,22 +246,15 @@ def get_git_head_sha(repo_path: Path | None = None) -> str | None:
     Returns:
         Full SHA string, or None if not in a git repo
     """
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return None
+    return _resolve_commit("HEAD", _repo_key(repo_path))
 
 
 def get_git_blob_sha(path: str, ref: str = "HEAD", repo_path: Path | None = None) -> str | None:
     """Get the git blob SHA for a file at a specific ref.
 
+    Resolves ``ref`` to a commit, then looks the path up in that commit's
+    memoized tree listing (one ``git ls-tree`` per commit).
+
     Args:
         path: Path to the file (relative to repo root)
         ref: Git ref (commit SHA, branch, tag, HEAD, etc.)
@@ -222,23 +263,12 @@ def get_git_blob_sha(path: str, ref: str = "HEAD", repo_path: Path | None = None
     Returns:
         Blob SHA string, or None if file doesn't exist at that ref
     """
-    # Use batched cache for common refs (HEAD, commit SHAs)
-    # This is ~50x faster than individual git rev-parse calls
-    is_sha_like = ref.isalnum() and len(ref) in (7, 8, 12, 40)  # short or full SHA
-    if ref == "HEAD" or is_sha_like:
-        blob_map = _get_blob_cache(ref, repo_path)
-        return blob_map.get(path)
-
-    # Individual lookup for other refs
+    repo_key = _repo_key(repo_path)
+    commit = _resolve_commit(ref, repo_key)
+    if commit is None:
+        return None
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", f"{ref}:{path}"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
+        return _list_tree(commit, repo_key).get(path)
     except (subprocess.CalledProcessError, FileNotFoundError):
         return None
 
@@ -309,23 +339,20 @@ def get_git_object_sha(path: str, ref: str = "HEAD", repo_path: Path | None = No
     path = path.rstrip("/")
 
     # Try blob cache first (fast path for files)
-    is_sha_like = ref.isalnum() and len(ref) in (7, 8, 12, 40)
-    if ref == "HEAD" or is_sha_like:
-        blob_map = _get_blob_cache(ref, repo_path)
-        blob_sha = blob_map.get(path)
-        if blob_sha is not None:
-            return blob_sha
+    blob_sha = get_git_blob_sha(path, ref, repo_path)
+    if blob_sha is not None:
+        return blob_sha
 
     # Fall back to git rev-parse (handles both blobs and trees)
     try:
         result = subprocess.run(
             ["git", "rev-parse", f"{ref}:{path}"],
             cwd=repo_path,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
-        return result.stdout.strip()
+        return result.stdout.strip().decode("ascii")
     except (subprocess.CalledProcessError, FileNotFoundError):
         return None
 
@@ -406,12 +433,15 @@ class OutputInfo:
     nfiles: int | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DVCFileInfo:
     """Content of a .dvc file.
 
     For side-effect stages (cmd + deps, no outputs), md5 and size are None.
 
+    Frozen: :func:`read_dvc_file` memoizes parses, and hands each caller a
+    copy with its own ``deps``/``git_deps``/``outs`` containers.
+
     ``outs`` is the authoritative list of outputs; scalar ``md5/size/path/
     is_dir/nfiles`` accessors mirror ``outs[0]`` for back-compat with
     single-output callers. New code should iterate ``outs`` directly.
@@ -459,6 +489,10 @@ def read_dvc_file(output_path: Path) -> DVCFileInfo | None:
 
     Handles both DVX format (computation block) and legacy format (meta block).
 
+    Parsed results are memoized by the .dvc file's mtime and size, so repeated reads
+    of an unchanged file (deps shared across stages, parent-dir walks) skip
+    YAML parsing. Each call returns its own copy, so callers may mutate it.
+
     Args:
         output_path: Path to the output file/directory, or directly to the .dvc file
 
@@ -466,18 +500,58 @@ def read_dvc_file(output_path: Path) -> DVCFileInfo | None:
         DVCFileInfo if .dvc file exists and is valid, None otherwise
     """
     # Support both output path and direct .dvc path
-    if output_path.suffix == ".dvc":
-        dvc_path = output_path
-    else:
-        dvc_path = Path(str(output_path) + ".dvc")
+    dvc_path = output_path if output_path.suffix == ".dvc" else get_dvc_file_path(output_path)
+
+    try:
+        st = dvc_path.stat()
+    except OSError:
+        return None
 
-    if not dvc_path.exists():
+    if time.time_ns() - st.st_mtime_ns < MTIME_MIN_AGE_NS:
+        # Written too recently for its mtime to identify this version (a
+        # same-tick rewrite wouldn't bump it); parse without caching.
+        return _parse_dvc_file(output_path, dvc_path)
+    # The parse depends on the path as given (relative dep resolution,
+    # inferred side-effect path), so key on that plus cwd, not just the file.
+    # Size too: an mtime-preserving copy (``cp -p``, ``rsync -t``) can swap
+    # the content under an old mtime.
+    info = _read_dvc_file_cached(str(output_path), os.getcwd(), st.st_mtime_ns, st.st_size)
+    if info is None:
         return None
+    # The memoized instance is shared; hand out copies of its containers so a
+    # caller mutating deps/outs can't corrupt later reads
+    return replace(
+        info,
+        deps=dict(info.deps),
+        git_deps=dict(info.git_deps),
+        outs=[replace(out) for out in info.outs],
+    )
 
-    with open(dvc_path) as f:
-        # Use CSafeLoader for ~5x faster parsing (falls back to SafeLoader if unavailable)
-        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
-        data = yaml.load(f, Loader=loader)  # noqa: S506
+
+def clear_dvc_file_cache() -> None:
+    """Drop all memoized :func:`read_dvc_file` results."""
+    _read_dvc_file_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=2048)
+def _read_dvc_file_cached(
+    output_path_str: str, cwd: str, mtime_ns: int, size: int,
+) -> DVCFileInfo | None:
+    output_path = Path(output_path_str)
+    dvc_path = output_path if output_path.suffix == ".dvc" else get_dvc_file_path(output_path)
+    return _parse_dvc_file(output_path, dvc_path)
+
+
+def _parse_dvc_file(output_path: Path, dvc_path: Path) -> DVCFileInfo | None:
+    """Parse a .dvc file into a :class:`DVCFileInfo` (uncached)."""
+    # Bytes in: the loader detects the encoding itself, skipping a text decode.
+    # Handing it the whole buffer (rather than the file object, which it
+    # pulls through a Python read callback) parses ~35% faster.
+    try:
+        with open(dvc_path, "rb") as f:
+            data = yaml.load(f.read(), Loader=_YAML_LOADER)  # noqa: S506
+    except FileNotFoundError:
+        return None
 
     if not data:
         return None
@@ -564,6 +638,103 @@ def read_dvc_file(output_path: Path) -> DVCFileInfo | None:
     )
 
 
+def _count_files(root: Path) -> int:
+    """Count files under ``root`` (recursive), like ``rglob`` + ``is_file``.
+
+    Uses ``os.scandir`` so file/dir type comes from the directory entry
+    itself — no ``Path`` per entry and no extra ``stat()`` per file (only
+    symlinks need one, to resolve their target). Symlinked dirs aren't
+    descended into, matching ``rglob``.
+    """
+    count = 0
+    pending = deque([os.fspath(root)])
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    count += 1
+                elif entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+    return count
+
+
+# Strings PyYAML would emit unquoted and unwrapped: no spaces, quotes or
+# indicator characters (nor a leading "---"/"..." document marker). Values
+# may also contain single spaces between words (e.g. a cmd), as long as the
+# line fits in yaml.dump's 80-column width, past which it wraps at a space.
+# Whether they'd resolve as another type (int, bool, timestamp, ...) is
+# checked separately against the resolver.
+_PLAIN_SCALAR_RE = re.compile(r"(?!---|\.\.\.)[A-Za-z0-9_./][A-Za-z0-9_./+-]*\Z")
+_PLAIN_WORDS_RE = re.compile(r"(?!---|\.\.\.)[A-Za-z0-9_./][A-Za-z0-9_./+-]*(?: [A-Za-z0-9_./+-]+)*\Z")
+_YAML_WIDTH = 80
+_YAML_RESOLVER = yaml.resolver.Resolver()
+
+
+def _plain_scalar(value, spaces: bool = False) -> str | None:
+    """``value`` as yaml.dump would render it in block context, if trivially so."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if (
+        isinstance(value, str)
+        and len(value) < 128  # longer mapping keys become "? key" complex keys
+        and (_PLAIN_WORDS_RE if spaces else _PLAIN_SCALAR_RE).match(value)
+        and _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == "tag:yaml.org,2002:str"
+    ):
+        return value
+    return None
+
+
+def _emit_block(obj, indent: int, first_prefix: str, lines: list[str]) -> bool:
+    """Append block-style lines for a mapping; False if it needs ``yaml.dump``."""
+    if not isinstance(obj, dict) or not obj:
+        return False
+    pad = " " * indent
+    prefix = first_prefix
+    for key, value in obj.items():
+        k = _plain_scalar(key)
+        if k is None or not isinstance(key, str):
+            return False
+        if isinstance(value, dict):
+            lines.append(f"{prefix}{k}:\n")
+            if not _emit_block(value, indent + 2, " " * (indent + 2), lines):
+                return False
+        elif isinstance(value, list):
+            if not value:
+                return False
+            lines.append(f"{prefix}{k}:\n")
+            for item in value:
+                if not _emit_block(item, indent + 2, f"{pad}- ", lines):
+                    return False
+        else:
+            v = _plain_scalar(value, spaces=True)
+            if v is None:
+                return False
+            line = f"{prefix}{k}: {v}"
+            if len(line) > _YAML_WIDTH and " " in v:
+                return False
+            lines.append(line + "\n")
+        prefix = pad
+    return True
+
+
+def _dump_dvc_yaml(data: dict) -> str:
+    """Serialize .dvc data exactly as ``yaml.dump(..., sort_keys=False)`` would.
+
+    The .dvc schema is a few nested mappings of hashes, sizes and paths, so
+    the common case is formatted directly instead of through PyYAML's
+    representer/emitter. Anything needing quoting, wrapping or flow style
+    (e.g. a cmd with quotes, or too long for one line) falls back to
+    ``yaml.dump`` itself, on PyYAML's pure-Python emitter like the old code: libyaml
+    wraps long quoted scalars differently, which would change rewritten files.
+    """
+    lines: list[str] = []
+    if _emit_block(data, 0, "", lines):
+        return "".join(lines)
+    return yaml.dump(data, sort_keys=False, default_flow_style=False)
+
+
 def write_dvc_file(
     output_path: Path,
     md5: str | None = None,
@@ -610,7 +781,7 @@ def write_dvc_file(
         Path to the created .dvc file
     """
     output_path = Path(output_path)
-    dvc_path = Path(str(output_path) + ".dvc")
+    dvc_path = get_dvc_file_path(output_path)
 
     # Ensure parent directory exists
     dvc_path.parent.mkdir(parents=True, exist_ok=True)
@@ -647,7 +818,7 @@ def write_dvc_file(
         else:
             # Single-output (historical) path.
             if is_dir is None:
-                is_dir = output_path.is_dir() if output_path.exists() else False
+                is_dir = output_path.is_dir()
 
             # Path in .dvc file should be relative to the .dvc file location (just the filename)
             relative_path = output_path.name
@@ -666,7 +837,7 @@ def write_dvc_file(
             if is_dir:
                 if nfiles is None and output_path.exists():
                     # Count files in directory
-                    nfiles = sum(1 for f in output_path.rglob("*") if f.is_file())
+                    nfiles = _count_files(output_path)
                 if nfiles is not None:
                     out_entry["nfiles"] = nfiles
 
@@ -694,12 +865,80 @@ def write_dvc_file(
             computation["fetch"] = fetch
         data["meta"] = {"computation": computation}
 
-    with open(dvc_path, "w") as f:
-        yaml.dump(data, f, sort_keys=False, default_flow_style=False)
+    content = _dump_dvc_yaml(data).encode()
+    try:
+        with open(dvc_path, "rb") as f:
+            unchanged = f.read() == content
+    except FileNotFoundError:
+        unchanged = False
+    if unchanged:
+        # Rewriting identical bytes would only bump the mtime, invalidating
+        # mtime-keyed memos of this file for nothing
+        return dvc_path
+
+    # A few hundred bytes: one unbuffered write, no stdio buffer or text layer
+    with open(dvc_path, "wb", buffering=0) as f:
+        f.write(content)
 
     return dvc_path
 
 
+class _NoFingerprint(Exception):
+    """A path's stat can't stand in for its content."""
+
+
+def _freshness_fingerprint(
+    output_path: Path,
+    info: DVCFileInfo,
+    check_deps: bool,
+) -> str | None:
+    """Stat fingerprint of everything :func:`is_output_fresh` reads.
+
+    Covers the .dvc file, each output, and (with ``check_deps``) each dep's
+    .dvc file (or the raw dep file) and each git dep. Returns None when a
+    stat can't stand in for content: directories (whose mtime doesn't track
+    nested files), missing paths, or anything modified within the racy-mtime
+    window.
+    """
+    output_path = Path(output_path)
+    now = time.time_ns()
+    parts = [str(int(check_deps))]
+
+    def add(path: Path) -> bool:
+        """Append ``path``'s stat; False if it's missing. Raises if unusable."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return False
+        if not stat.S_ISREG(st.st_mode) or now - st.st_mtime_ns < MTIME_MIN_AGE_NS:
+            raise _NoFingerprint
+        parts.append(f"{path}:{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}:{st.st_ctime_ns}")
+        return True
+
+    try:
+        if not add(output_path if output_path.suffix == ".dvc" else get_dvc_file_path(output_path)):
+            return None
+        if not info.is_side_effect:
+            for out in info.outs:
+                if not add(output_path.parent / out.path):
+                    return None
+        if check_deps:
+            for dep_path in info.deps:
+                dep = Path(dep_path)
+                dep_dvc = dep if dep.suffix == ".dvc" else get_dvc_file_path(dep)
+                # A dep is compared via its .dvc file if it has a readable
+                # one, else hashed directly. Which it is depends on current
+                # state, and the chosen path is part of the fingerprint.
+                if not (add(dep_dvc) and read_dvc_file(dep) is not None) and not add(dep):
+                    return None
+            for dep_path in info.git_deps:
+                if not add(Path(dep_path)):
+                    return None
+    except (_NoFingerprint, OSError):
+        return None
+    return "|".join(parts)
+
+
 def is_output_fresh(
     output_path: Path,
     check_deps: bool = True,
@@ -734,6 +973,20 @@ def is_output_fresh(
     if info.fetch_schedule and is_fetch_due(info.fetch_schedule, info.fetch_last_run):
         return False, "fetch schedule due"
 
+    # If nothing the verdict depends on has been touched since it was last
+    # found fresh, skip the hashing and dep checks entirely. Taken before the
+    # full check, so a change made during it invalidates the recorded state.
+    # Verdicts live in the status DB only if it already exists: a freshness
+    # query never creates ``.dvc/dvx.db`` just for them.
+    fingerprint = None
+    if use_mtime_cache:
+        fingerprint = _freshness_fingerprint(output_path, info, check_deps)
+        if fingerprint is not None:
+            fresh_key = os.path.abspath(output_path)
+            db = find_status_db()
+            if db is not None and db.get_fresh(fresh_key) == fingerprint:
+                return True, "up-to-date"
+
     # Side-effect stages have no output to check — freshness is purely dep-based
     if not info.is_side_effect:
         # Multi-output: iterate every ``outs[i]``. ``output_path`` is the
@@ -748,9 +1001,8 @@ def is_output_fresh(
                     return False, f"output missing: {out.path}"
                 return False, "output missing"
             if use_mtime_cache:
-                from dvx.run.status import get_artifact_hash_cached
                 try:
-                    current_md5, _, _was_cached = get_artifact_hash_cached(out_path, compute_md5)
+                    current_md5, _, _was_cached = get_artifact_hash_cached(out_path, compute_md5_cached)
                 except (FileNotFoundError, ValueError) as e:
                     return False, f"hash error: {e}"
             else:
@@ -771,6 +1023,7 @@ def is_output_fresh(
     # Check dependencies if requested
     # Compare recorded dep hashes against dep's .dvc file (not actual data)
     if check_deps and info.deps:
+        raw_deps = []
         for dep_path, recorded_md5 in info.deps.items():
             dep = Path(dep_path)
             # Try to read dep's .dvc file
@@ -779,19 +1032,22 @@ def is_output_fresh(
                 # No .dvc file - dep might be a raw file
                 if not dep.exists():
                     return False, f"dep missing: {dep_path}"
-                # Raw file exists — compute actual hash and compare
-                try:
-                    actual_md5 = compute_md5(dep)
-                except (FileNotFoundError, ValueError) as e:
-                    return False, f"dep hash error: {dep_path}: {e}"
-                if actual_md5 != recorded_md5:
-                    return False, f"dep changed: {dep_path}"
+                # Raw file exists — hashed below, alongside the other raw deps
+                raw_deps.append((dep_path, recorded_md5, dep))
                 continue
 
             # Compare our recorded hash against dep's .dvc expected hash
             if dep_info.md5 != recorded_md5:
                 return False, f"dep changed: {dep_path}"
 
+        # Compute raw deps' actual hashes and compare
+        hashes = compute_md5_many([dep for _, _, dep in raw_deps], return_exceptions=True)
+        for (dep_path, recorded_md5, _), actual_md5 in zip(raw_deps, hashes, strict=True):
+            if isinstance(actual_md5, Exception):
+                return False, f"dep hash error: {dep_path}: {actual_md5}"
+            if actual_md5 != recorded_md5:
+                return False, f"dep changed: {dep_path}"
+
     # Check git dependencies if requested
     # Compare recorded SHAs against the worktree (blob via `git hash-object`
     # for files, HEAD tree SHA fallback for directories).
@@ -803,6 +1059,11 @@ def is_output_fresh(
             if current_sha != recorded_sha:
                 return False, f"git dep changed: {dep_path}"
 
+    if fingerprint is not None:
+        # Output hashing above opens the DB for stages with outputs
+        db = find_status_db()
+        if db is not None:
+            db.set_fresh(fresh_key, fingerprint)
     return True, "up-to-date"
 
 
@@ -872,9 +1133,8 @@ def get_freshness_details(
                     output_expected=out.md5,
                 )
             if use_mtime_cache:
-                from dvx.run.status import get_artifact_hash_cached
                 try:
-                    md5_now, _, _ = get_artifact_hash_cached(out_path, compute_md5)
+                    md5_now, _, _ = get_artifact_hash_cached(out_path, compute_md5_cached)
                 except (FileNotFoundError, ValueError) as e:
                     return FreshnessDetails(fresh=False, reason=f"hash error: {e}")
             else:
@@ -898,19 +1158,24 @@ def get_freshness_details(
     if check_deps and info.deps:
         changed_deps = {}
 
+        # Hash all existing raw deps (no .dvc file) up front, in parallel
+        dep_infos = {dep_path: read_dvc_file(Path(dep_path)) for dep_path in info.deps}
+        raw_deps = [p for p, dep_info in dep_infos.items() if dep_info is None and Path(p).exists()]
+        raw_hashes = dict(zip(
+            raw_deps,
+            compute_md5_many([Path(p) for p in raw_deps], return_exceptions=True),
+            strict=True,
+        ))
+
         for dep_path, recorded_md5 in info.deps.items():
-            dep = Path(dep_path)
-            # Try to read dep's .dvc file
-            dep_info = read_dvc_file(dep)
+            dep_info = dep_infos[dep_path]
             if dep_info is None:
                 # No .dvc file - dep might be a raw file
-                if not dep.exists():
+                if dep_path not in raw_hashes:
                     changed_deps[dep_path] = {"expected": recorded_md5, "expected_commit": None, "actual": "(missing)"}
                     continue
-                # Raw file exists — compute actual hash and compare
-                try:
-                    actual_md5 = compute_md5(dep)
-                except (FileNotFoundError, ValueError):
+                actual_md5 = raw_hashes[dep_path]
+                if isinstance(actual_md5, Exception):
                     changed_deps[dep_path] = {"expected": recorded_md5, "expected_commit": None, "actual": "(error)"}
                     continue
                 if actual_md5 != recorded_md5:
@@ -984,13 +1249,25 @@ def get_dvc_file_path(output_path: Path) -> Path:
     Returns:
         Path to the .dvc file (may not exist)
     """
-    return Path(str(output_path) + ".dvc")
+    # The same outputs/deps are looked up over and over while building and
+    # checking a graph; a str-keyed hit is far cheaper than deriving a new Path.
+    return _dvc_file_path(os.fspath(output_path))
+
+
+@functools.lru_cache(maxsize=4096)
+def _dvc_file_path(output_path_str: str) -> Path:
+    output_path = Path(output_path_str)
+    # Swap the last component only, instead of re-parsing a concatenated string
+    return output_path.with_name(output_path.name + ".dvc")
 
 
 def find_parent_dvc_dir(file_path: Path) -> tuple[Path, str] | None:
     """Find a DVC-tracked parent directory containing a file.
 
-    Walks up the directory tree looking for a directory with a .dvc file.
+    Walks up the directory tree looking for a directory with a .dvc file,
+    stopping at the git repo root. Each level's .dvc file goes through
+    :func:`read_dvc_file`'s mtime-keyed memo, so lookups for many files
+    under the same tree don't re-parse it.
 
     Args:
         file_path: Path to a file (must be a file, not directory)
@@ -1007,14 +1284,14 @@ def find_parent_dvc_dir(file_path: Path) -> tuple[Path, str] | None:
     current = path.parent
 
     while current != current.parent:  # Stop at filesystem root
-        dvc_path = get_dvc_file_path(current)
-        if dvc_path.exists():
-            # Found a .dvc file for this directory
-            info = read_dvc_file(current)
-            if info and info.is_dir:
-                # Return the directory path and relative path to the file
-                relpath = "/".join(reversed(rel_parts))
-                return current, relpath
+        info = read_dvc_file(current)
+        if info is not None and info.is_dir:
+            # Return the directory path and relative path to the file
+            relpath = "/".join(reversed(rel_parts))
+            return current, relpath
+        if (current / ".git").exists():
+            # Tracked dirs live inside the repo; nothing above it can match
+            break
 
         # Walk up one level
         rel_parts.append(current.name)
@@ -1035,8 +1312,6 @@ def read_dir_manifest(dir_md5: str, cache_dir: Path | None = None) -> dict[str,
     Returns:
         Dict mapping relative paths to their MD5 hashes
     """
-    import json
-
     if cache_dir is None:
         # Auto-detect cache directory by walking up from cwd
         cwd = Path.cwd()
@@ -1055,14 +1330,23 @@ def read_dir_manifest(dir_md5: str, cache_dir: Path | None = None) -> dict[str,
     else:
         hash_base = dir_md5
     manifest_path = cache_dir / hash_base[:2] / f"{hash_base[2:]}.dir"
-    if not manifest_path.exists():
+    try:
+        return dict(_read_dir_manifest_cached(str(manifest_path)))
+    except (FileNotFoundError, NotADirectoryError):
         return {}
 
-    with open(manifest_path) as f:
-        entries = json.load(f)
 
-    # Convert [{md5: ..., relpath: ...}, ...] to {relpath: md5}
-    return {entry["relpath"]: entry["md5"] for entry in entries}
+@functools.lru_cache(maxsize=128)
+def _read_dir_manifest_cached(manifest_path_str: str) -> tuple[tuple[str, str], ...]:
+    # Manifests are content-addressed (the path embeds their hash), so a
+    # cached parse never goes stale. Pairs are returned as an immutable tuple
+    # so callers can't mutate the cached value.
+    with open(manifest_path_str, "rb") as f:
+        data = f.read()
+    entries = orjson.loads(data) if orjson is not None else json.loads(data)
+
+    # Convert [{md5: ..., relpath: ...}, ...] to ((relpath, md5), ...)
+    return tuple((entry["relpath"], entry["md5"]) for entry in entries)
 
 
 def get_file_hash_from_dir(
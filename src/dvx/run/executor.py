@@ -7,6 +7,7 @@ Uses the provenance information in .dvc files (computation blocks).
 import subprocess
 import sys
 import threading
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -14,7 +15,7 @@ from typing import TextIO
 
 from dvx.run.artifact import Artifact
 from dvx.run.dvc_files import is_output_fresh, write_dvc_file
-from dvx.run.hash import compute_file_size, compute_md5
+from dvx.run.hash import compute_path_stats
 
 
 @dataclass
@@ -74,51 +75,50 @@ def _group_into_levels(artifacts: list[Artifact]) -> list[list[Artifact]]:
     Returns:
         List of levels, where each level is a list of artifacts
     """
-    # Track which artifacts are "done" (either executed or scheduled)
+    # Kahn's algorithm, a level at a time: each artifact waits on its distinct
+    # dep paths (deps and git_deps), and becomes ready once an artifact with
+    # each of those paths has been placed. Leaf nodes are always ready.
+    waiting = [0] * len(artifacts)
+    dependents: dict[str, list[int]] = defaultdict(list)  # {dep path: [artifact index, ...]}
+    ready: list[int] = []
+    for i, artifact in enumerate(artifacts):
+        if artifact.computation is not None:
+            dep_paths = {
+                dep.path if isinstance(dep, Artifact) else str(dep)
+                for dep in (*artifact.computation.deps, *artifact.computation.git_deps)
+            }
+            for dep_path in dep_paths:
+                dependents[dep_path].append(i)
+            waiting[i] = len(dep_paths)
+        if not waiting[i]:
+            ready.append(i)
+
+    # Track which artifact paths are "done" (either executed or scheduled)
     done: set[str] = set()
     levels: list[list[Artifact]] = []
+    placed = 0
 
-    remaining = list(artifacts)
-
-    while remaining:
-        # Find artifacts whose deps are all done
-        ready = []
-        not_ready = []
-
-        for artifact in remaining:
-            if artifact.computation is None:
-                # Leaf nodes are always ready
-                ready.append(artifact)
-            else:
-                # Check if all deps (including git_deps) are done
-                deps_done = True
-                for dep in artifact.computation.deps:
-                    dep_path = dep.path if isinstance(dep, Artifact) else str(dep)
-                    if dep_path not in done:
-                        deps_done = False
-                        break
-                if deps_done:
-                    for dep in artifact.computation.git_deps:
-                        dep_path = dep.path if isinstance(dep, Artifact) else str(dep)
-                        if dep_path not in done:
-                            deps_done = False
-                            break
-
-                if deps_done:
-                    ready.append(artifact)
-                else:
-                    not_ready.append(artifact)
+    while ready:
+        level = [artifacts[i] for i in ready]
+        levels.append(level)
+        placed += len(level)
 
-        if not ready:
-            # This shouldn't happen with a valid DAG
-            raise RuntimeError("Circular dependency detected")
-
-        # Add ready artifacts to current level
-        levels.append(ready)
-        for a in ready:
+        next_ready = []
+        for a in level:
+            if a.path in done:
+                continue
             done.add(a.path)
-
-        remaining = not_ready
+            for j in dependents.pop(a.path, ()):
+                waiting[j] -= 1
+                if not waiting[j]:
+                    next_ready.append(j)
+        # Keep each level in input order
+        next_ready.sort()
+        ready = next_ready
+
+    if placed < len(artifacts):
+        # Unsatisfiable deps: a cycle, or a dep that isn't in `artifacts`
+        raise RuntimeError("Circular dependency detected")
 
     return levels
 
@@ -623,23 +623,18 @@ class ParallelExecutor:
                 # .dvc back with all N entries updated.
                 new_outs: list[OutputInfo] = []
                 for declared, real_path in zip(declared_outs, output_paths):
-                    out_md5 = compute_md5(real_path)
-                    out_size = compute_file_size(real_path)
-                    is_dir_o = real_path.is_dir()
+                    stats = compute_path_stats(real_path)
                     try:
-                        cache_blob(real_path, out_md5)
+                        cache_blob(real_path, stats.md5)
                     except Exception as e:
                         self._log(f"  ⚠ {declared.path}: couldn't cache output: {e}")
-                    nfiles_o = None
-                    if is_dir_o:
-                        nfiles_o = sum(1 for f in real_path.rglob("*") if f.is_file())
                     new_outs.append(
                         OutputInfo(
                             path=declared.path,
-                            md5=out_md5,
-                            size=out_size,
-                            is_dir=is_dir_o,
-                            nfiles=nfiles_o,
+                            md5=stats.md5,
+                            size=stats.size,
+                            is_dir=stats.nfiles is not None,
+                            nfiles=stats.nfiles,
                         )
                     )
 
@@ -653,16 +648,16 @@ class ParallelExecutor:
                     fetch_last_run=fetch_last_run,
                 )
             else:
-                md5 = compute_md5(out)
-                size = compute_file_size(out)
+                stats = compute_path_stats(out)
                 try:
-                    cache_blob(out, md5)
+                    cache_blob(out, stats.md5)
                 except Exception as e:
                     self._log(f"  ⚠ {path}: couldn't cache output: {e}")
                 dvc_file = write_dvc_file(
                     output_path=out,
-                    md5=md5,
-                    size=size,
+                    md5=stats.md5,
+                    size=stats.size,
+                    nfiles=stats.nfiles,
                     cmd=cmd if self.config.provenance else None,
                     deps=deps_hashes if self.config.provenance else None,
                     git_deps=git_deps_hashes if self.config.provenance else None,
@@ -759,13 +754,12 @@ class ParallelExecutor:
 
         # Compute hash and write .dvc file
         try:
-            md5 = compute_md5(out)
-            size = compute_file_size(out)
+            stats = compute_path_stats(out)
 
             # Cache the co-output blob
             try:
                 from dvx.cache import cache_blob
-                cache_blob(out, md5)
+                cache_blob(out, stats.md5)
             except Exception as e:
                 self._log(f"  ⚠ {path}: couldn't cache co-output: {e}")
 
@@ -777,8 +771,9 @@ class ParallelExecutor:
 
             dvc_file = write_dvc_file(
                 output_path=out,
-                md5=md5,
-                size=size,
+                md5=stats.md5,
+                size=stats.size,
+                nfiles=stats.nfiles,
                 cmd=cmd if self.config.provenance else None,
                 deps=deps_hashes if self.config.provenance else None,
                 git_deps=git_deps_hashes if self.config.provenance else None,
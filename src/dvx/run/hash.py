@@ -1,7 +1,13 @@
 """DVC-compatible MD5 hash computation."""
 
+import functools
 import hashlib
 import json
+import os
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 
@@ -31,7 +37,16 @@ def compute_md5(file_path: Path) -> str:
     raise ValueError(f"{file_path} is neither file nor directory")
 
 
-def _hash_file(file_path: Path) -> str:
+def _md5(data: bytes = b""):
+    # DVC's content addressing, not a security use; allowed on FIPS builds
+    return hashlib.md5(data, usedforsecurity=False)
+
+
+# Files below this are read whole rather than streamed in chunks
+_SMALL_FILE_BYTES = 64 * 1024
+
+
+def _hash_file(file_path: str | Path) -> str:
     """Hash contents of a single file.
 
     Args:
@@ -40,40 +55,149 @@ def _hash_file(file_path: Path) -> str:
     Returns:
         MD5 hash of file contents
     """
-    md5 = hashlib.md5()  # noqa: S324
     with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _SMALL_FILE_BYTES:
+            # One read and one update: about half the per-file overhead of
+            # file_digest's buffered read loop
+            return _md5(f.read()).hexdigest()
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: read loop runs in C
+            return hashlib.file_digest(f, _md5).hexdigest()
+        md5 = _md5()
         # Read in 64KB chunks to handle large files efficiently
         for chunk in iter(lambda: f.read(65536), b""):
             md5.update(chunk)
     return md5.hexdigest()
 
 
+# Files modified more recently than this aren't memoized by mtime: coarse
+# mtime granularity means a rewrite within the same tick can keep the same mtime.
+MTIME_MIN_AGE_NS = 2_000_000_000
+
+
+def compute_md5_cached(file_path: Path) -> str:
+    """``compute_md5`` with a process-wide memo for regular files.
+
+    Keyed on ``(realpath, size, mtime_ns)``, so the same file reached via
+    differently-spelled paths (a script shared by many stages) is hashed
+    once per version. Directories (whose mtime doesn't track content) and
+    just-modified files bypass the memo; ``clear_md5_cache`` empties it.
+    """
+    st = file_path.stat()
+    if not stat.S_ISREG(st.st_mode):
+        return compute_md5(file_path)
+    if time.time_ns() - st.st_mtime_ns < MTIME_MIN_AGE_NS:
+        return _hash_file(file_path)
+    return _md5_memo(os.path.realpath(file_path), st.st_size, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8192)
+def _md5_memo(realpath: str, size: int, mtime_ns: int) -> str:
+    return _hash_file(realpath)
+
+
+def clear_md5_cache() -> None:
+    """Forget memoized ``compute_md5_cached`` results."""
+    _md5_memo.cache_clear()
+
+
 def _hash_directory(dir_path: Path) -> str:
     """Hash a directory using DVC's .dir manifest format.
 
+    Args:
+        dir_path: Path to directory
+
+    Returns:
+        MD5 hash of the DVC-format directory manifest
+    """
+    return walk_dir_stats(dir_path).md5
+
+
+# Below this much data, thread start-up and hand-off outweigh parallel hashing
+_PARALLEL_HASH_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _map_hashes(hash_fn, paths: list, total_size: int) -> list[str]:
+    """``[hash_fn(p) for p in paths]``, on a thread pool if there's enough to hash."""
+    workers = min(32, os.cpu_count() or 1, len(paths))
+    if workers > 1 and total_size >= _PARALLEL_HASH_MIN_BYTES:
+        # hashlib releases the GIL while digesting, so files hash in parallel
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(hash_fn, paths))
+    return [hash_fn(path) for path in paths]
+
+
+def compute_md5_many(paths: list[Path], return_exceptions: bool = False) -> list:
+    """``compute_md5_cached`` of each path, in order; hashed in parallel when large enough.
+
+    Directories don't count toward the parallelism threshold (their own walk
+    parallelizes its files). With ``return_exceptions``, a path that can't be
+    hashed (``FileNotFoundError``/``ValueError``) yields its exception in place
+    of a hash instead of raising.
+    """
+    total_size = 0
+    for path in paths:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            if return_exceptions:
+                continue
+            raise
+        if stat.S_ISREG(st.st_mode):
+            total_size += st.st_size
+    hash_fn = _md5_or_error if return_exceptions else compute_md5_cached
+    return _map_hashes(hash_fn, paths, total_size)
+
+
+def _md5_or_error(path: Path) -> str | Exception:
+    try:
+        return compute_md5_cached(path)
+    except (FileNotFoundError, ValueError) as e:
+        return e
+
+
+@dataclass(frozen=True)
+class PathStats:
+    """What a .dvc entry records about an output (``nfiles`` only for directories)."""
+
+    md5: str
+    size: int
+    nfiles: int | None = None
+
+
+def walk_dir_stats(dir_path: Path) -> PathStats:
+    """Hash, total size, and file count of a directory, from one walk.
+
     DVC represents directory contents as a JSON list of {md5, relpath} objects,
-    sorted by relpath. The directory hash is the MD5 of this JSON.
+    sorted by relpath. The directory hash is the MD5 of this JSON. Size and
+    file count agree with ``compute_file_size`` (symlinked directories are not
+    descended into).
 
     Args:
         dir_path: Path to directory
 
     Returns:
-        MD5 hash of the DVC-format directory manifest
+        PathStats with the .dir manifest hash, summed file size, and file count
     """
-    entries = []
-
-    # Recursively collect all files in directory
-    for subfile in dir_path.rglob("*"):
-        if subfile.is_file():
-            rel_path = subfile.relative_to(dir_path)
-            # Use forward slashes for cross-platform compatibility (DVC convention)
-            rel_path_str = str(rel_path).replace("\\", "/")
-            entries.append(
-                {
-                    "md5": _hash_file(subfile),
-                    "relpath": rel_path_str,
-                }
-            )
+    files: list[tuple[str, str]] = []  # (relpath, path)
+    size = 0
+
+    # Iterative scandir walk; relpaths use forward slashes (DVC convention)
+    stack = [(os.fspath(dir_path), "")]
+    while stack:
+        path, prefix = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{prefix}{entry.name}/"))
+                elif entry.is_file():
+                    files.append((prefix + entry.name, entry.path))
+                    size += entry.stat().st_size
+
+    md5s = _map_hashes(_hash_file, [path for _, path in files], size)
+    entries = [
+        {"md5": md5, "relpath": relpath}
+        for (relpath, _), md5 in zip(files, md5s, strict=True)
+    ]
 
     # Sort by relpath (DVC convention)
     entries.sort(key=lambda e: e["relpath"])
@@ -81,7 +205,23 @@ def _hash_directory(dir_path: Path) -> str:
     # Hash the JSON representation
     # DVC uses separators=(', ', ': ') - space after comma and colon
     json_str = json.dumps(entries, separators=(", ", ": "))
-    return hashlib.md5(json_str.encode()).hexdigest()  # noqa: S324
+    md5 = _md5(json_str.encode()).hexdigest()
+    return PathStats(md5=md5, size=size, nfiles=len(entries))
+
+
+def compute_path_stats(file_path: Path) -> PathStats:
+    """MD5, size and (for directories) file count, walking a directory only once.
+
+    Equivalent to ``compute_md5`` + ``compute_file_size`` (+ counting files);
+    a file's hash goes through ``compute_md5_cached``.
+
+    Raises:
+        FileNotFoundError: If file_path doesn't exist
+        ValueError: If file_path is neither file nor directory
+    """
+    if file_path.is_dir():
+        return walk_dir_stats(file_path)
+    return PathStats(md5=compute_md5_cached(file_path), size=compute_file_size(file_path))
 
 
 def compute_file_size(file_path: Path) -> int:
@@ -101,9 +241,24 @@ def compute_file_size(file_path: Path) -> int:
     if file_path.is_file():
         return file_path.stat().st_size
     if file_path.is_dir():
-        total = 0
-        for subfile in file_path.rglob("*"):
-            if subfile.is_file():
-                total += subfile.stat().st_size
-        return total
+        return _walk_size(file_path)
     raise ValueError(f"{file_path} is neither file nor directory")
+
+
+def _walk_size(dir_path: Path) -> int:
+    """Sum file sizes under ``dir_path``.
+
+    Uses ``os.scandir`` so the file/dir checks come from the directory
+    listing; only the size lookup costs a ``stat`` per file. Like
+    ``rglob``, symlinked directories are not descended into.
+    """
+    total = 0
+    stack = [dir_path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    total += entry.stat().st_size
+    return total
@@ -67,14 +67,7 @@ class ArtifactStatusDB:
 
     def _find_db_path(self) -> Path:
         """Find or create .dvc/dvx.db path."""
-        # Look for .dvc directory starting from cwd and going up
-        cwd = Path.cwd()
-        for parent in [cwd, *cwd.parents]:
-            dvc_dir = parent / ".dvc"
-            if dvc_dir.is_dir():
-                return dvc_dir / "dvx.db"
-        # Fall back to cwd/.dvc/dvx.db (will be created)
-        return cwd / ".dvc" / "dvx.db"
+        return _default_db_path()
 
     def _init_db(self) -> None:
         """Run one-shot DB setup: WAL mode + schema. Idempotent."""
@@ -96,6 +89,13 @@ class ArtifactStatusDB:
                 CREATE INDEX IF NOT EXISTS idx_artifact_status_path
                 ON artifact_status(path)
             """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS fresh_status (
+                    path TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
         finally:
             conn.close()
 
@@ -184,6 +184,38 @@ class ArtifactStatusDB:
         )
         return cursor.rowcount > 0
 
+    def get_fresh(self, path: str | Path) -> str | None:
+        """Get the fingerprint recorded when an artifact was last verified fresh.
+
+        Args:
+            path: Path to the artifact
+
+        Returns:
+            Fingerprint string if recorded, None otherwise
+        """
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT fingerprint FROM fresh_status WHERE path = ?",
+            (str(path),),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def set_fresh(self, path: str | Path, fingerprint: str) -> None:
+        """Record that an artifact was verified fresh in the given state.
+
+        Args:
+            path: Path to the artifact
+            fingerprint: Stat fingerprint of the artifact, its .dvc file and deps
+        """
+        conn = self._get_connection()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO fresh_status (path, fingerprint, updated_at)
+            VALUES (?, ?, ?)
+            """,
+            (str(path), fingerprint, time.time()),
+        )
+
     def clear(self) -> int:
         """Clear all cached status records.
 
@@ -192,7 +224,9 @@ class ArtifactStatusDB:
         """
         conn = self._get_connection()
         cursor = conn.execute("DELETE FROM artifact_status")
-        return cursor.rowcount
+        deleted = cursor.rowcount
+        cursor = conn.execute("DELETE FROM fresh_status")
+        return deleted + cursor.rowcount
 
     def close(self):
         """Close the database connection."""
@@ -201,6 +235,18 @@ class ArtifactStatusDB:
             self._local.conn = None
 
 
+def _default_db_path() -> Path:
+    """``.dvc/dvx.db`` in the nearest ``.dvc`` dir at or above cwd (or cwd's)."""
+    # Look for .dvc directory starting from cwd and going up
+    cwd = Path.cwd()
+    for parent in [cwd, *cwd.parents]:
+        dvc_dir = parent / ".dvc"
+        if dvc_dir.is_dir():
+            return dvc_dir / "dvx.db"
+    # Fall back to cwd/.dvc/dvx.db (will be created)
+    return cwd / ".dvc" / "dvx.db"
+
+
 # Module-level singleton for convenience
 _default_db: ArtifactStatusDB | None = None
 _default_db_lock = Lock()
@@ -222,6 +268,16 @@ def get_status_db() -> ArtifactStatusDB:
     return _default_db
 
 
+def find_status_db() -> ArtifactStatusDB | None:
+    """The default status database if it's open or already on disk, else None.
+
+    For opportunistic caches that shouldn't create ``.dvc/dvx.db`` themselves.
+    """
+    if _default_db is not None or _default_db_path().exists():
+        return get_status_db()
+    return None
+
+
 def get_artifact_hash_cached(
     path: Path,
     compute_hash_fn,
@@ -0,0 +1,117 @@
+"""Shared pytest configuration.
+
+Test temp dirs (``tmp_path`` etc.) are placed on ``/dev/shm`` when it's a
+writable tmpfs, so the many small fixture writes never touch a disk. To
+opt out (e.g. on CI runners that restrict ``/dev/shm``), set
+``DVX_TEST_NO_SHM=1``, or point ``PYTEST_DEBUG_TEMPROOT`` at another
+directory; an explicit ``--basetemp`` also takes precedence.
+
+A git committer identity is provided through the environment for the whole
+session, so repo fixtures don't each spawn ``git config user.*``. Repo
+fixtures start from ``init_git_dvc_repo``, a copy of one ``git init`` +
+``dvc init`` repo built per session, instead of initializing each repo;
+``git_dvc_repo_with_remote`` likewise copies one already committed, with a
+local remote.
+"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+_GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Test",
+    "GIT_AUTHOR_EMAIL": "test@test.com",
+    "GIT_COMMITTER_NAME": "Test",
+    "GIT_COMMITTER_EMAIL": "test@test.com",
+}
+
+
+def pytest_configure(config):
+    shm = Path("/dev/shm")
+    if (
+        config.option.basetemp is None
+        and not os.environ.get("DVX_TEST_NO_SHM")
+        and shm.is_dir()
+        and os.access(shm, os.W_OK)
+    ):
+        # pytest roots its numbered ``pytest-of-<user>`` temp dirs here; set
+        # before any tmp_path is created, and inherited by xdist workers.
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(shm))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _git_identity():
+    """Committer identity for every ``git commit`` the tests run (and their subprocesses)."""
+    with pytest.MonkeyPatch.context() as mp:
+        for k, v in _GIT_IDENTITY.items():
+            mp.setenv(k, v)
+        yield
+
+
+@pytest.fixture(scope="session")
+def _git_dvc_template(tmp_path_factory):
+    """``git init -b main`` + ``dvc init``, run once per session."""
+    from dvc.repo import Repo
+
+    template = tmp_path_factory.mktemp("git_dvc_template")
+    subprocess.run(
+        ["git", "init", "-b", "main"], cwd=template, check=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    # In-process, rather than a `dvc` interpreter start per repo
+    Repo.init(str(template)).close()
+    return template
+
+
+@pytest.fixture(scope="session")
+def init_git_dvc_repo(_git_dvc_template):
+    """Factory: ``init_git_dvc_repo(path)`` makes ``path`` a fresh git + DVC repo (uncommitted).
+
+    With ``remote=``, also configures it as the default remote ``local``
+    (``dvc remote add -d local <remote>``), in-process. A relative ``remote``
+    is taken relative to ``path/.dvc`` and stored relative, so the remote
+    follows the repo if it is copied.
+    """
+
+    def init(path: Path, remote: Path | None = None) -> Path:
+        shutil.copytree(_git_dvc_template, path, symlinks=True, dirs_exist_ok=True)
+        if remote is not None:
+            from dvc.repo import Repo
+
+            if not remote.is_absolute():
+                # DVC reads a relative URL as cwd-relative, then stores it
+                # relative to the config dir
+                remote = Path(os.path.relpath(path / ".dvc" / remote))
+            with Repo(str(path)) as repo, repo.config.edit() as conf:
+                conf["remote"]["local"] = {"url": str(remote)}
+                conf["core"]["remote"] = "local"
+        return path
+
+    return init
+
+
+@pytest.fixture(scope="session")
+def _git_dvc_remote_template(tmp_path_factory, init_git_dvc_repo):
+    """``init_git_dvc_repo`` with remote ``../../remote``, committed, built once per session."""
+    repo = tmp_path_factory.mktemp("git_dvc_remote_template") / "repo"
+    init_git_dvc_repo(repo, remote=Path("../../remote"))
+    for cmd in (["git", "add", "."], ["git", "commit", "-m", "init"]):
+        # stdout discarded; stderr kept for CalledProcessError diagnostics
+        subprocess.run(cmd, cwd=repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    return repo
+
+
+@pytest.fixture
+def git_dvc_repo_with_remote(tmp_path, _git_dvc_remote_template):
+    """``(repo, remote)``: a committed git + DVC repo at ``tmp_path/repo``.
+
+    Its default remote ``local`` is the (empty) ``tmp_path/remote``.
+    """
+    repo = tmp_path / "repo"
+    remote = tmp_path / "remote"
+    shutil.copytree(_git_dvc_remote_template, repo, symlinks=True)
+    remote.mkdir()
+    return repo, remote
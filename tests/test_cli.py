@@ -4,9 +4,10 @@ Assertions parse CLI output into structured forms and assert exact
 equality / set equality / regex match. Avoid bare ``in result.output``.
 """
 
-import os
+import hashlib
+import json
 import re
-import subprocess
+import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -15,6 +16,26 @@ import yaml
 from click.testing import CliRunner
 
 from dvx.cli import cli
+from dvx.run.hash import compute_md5
+from tests.yaml_util import YAML_DUMPER
+
+
+def _write_dvc(path, md5, size, rel_path, hash_algo=None, computation=None):
+    """Write a single-output ``.dvc`` file, serialized up front and written once."""
+    out = {"md5": md5, "size": size, "path": rel_path}
+    if hash_algo:
+        out["hash"] = hash_algo
+    doc = {"outs": [out]}
+    if computation:
+        doc["meta"] = {"computation": computation}
+    path.write_text(yaml.dump(doc, Dumper=YAML_DUMPER))
+
+
+# MD5s of the fixed file contents the tests write, computed once from the bytes
+_MD5 = {
+    text: hashlib.md5(text.encode()).hexdigest()  # noqa: S324
+    for text in ("input data\n", "fresh data\n", "test data\n", "input\n", "output\n")
+}
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -90,6 +111,20 @@ def parse_click_help(output: str) -> ClickHelp:
     )
 
 
+def render_help(*names: str) -> str:
+    """``cli <names...> --help`` text, rendered directly from the command tree.
+
+    Skips ``CliRunner.invoke``'s stream capture and exit handling; Click
+    formats help identically either way.
+    """
+    cmd = cli
+    ctx = cli.make_context("cli", [], resilient_parsing=True)
+    for name in names:
+        cmd = cmd.get_command(ctx, name)
+        ctx = cmd.make_context(name, [], parent=ctx, resilient_parsing=True)
+    return cmd.get_help(ctx)
+
+
 @dataclass
 class Version:
     dvx: str  # full version string
@@ -145,42 +180,59 @@ def parse_status(output: str) -> StatusOutput:
     return r
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
-    """Create a Click CLI test runner."""
+    """Click CLI test runner, shared across tests (``invoke`` keeps no state)."""
     return CliRunner()
 
 
-@pytest.fixture
-def temp_dvc_repo(tmp_path):
-    """Create a temporary DVC repository."""
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=tmp_path,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=tmp_path,
-        capture_output=True,
-        check=True,
-    )
+@pytest.fixture(scope="session")
+def _dvc_repo_template(tmp_path_factory):
+    """Build a git + DVC repo once per session, for ``dvc_workdir`` to copy."""
+    from dulwich import porcelain
+    from dvc.repo import Repo
+
+    template = tmp_path_factory.mktemp("dvc_template")
+    # Initialize git repo in-process (dulwich ships with DVC's scmrepo)
+    porcelain.init(str(template)).close()
+
+    # Initialize DVC in-process rather than exec'ing the `dvc` CLI
+    Repo.init(str(template)).close()
+
+    return template
+
 
-    # Initialize DVC
-    subprocess.run(["dvc", "init"], cwd=tmp_path, capture_output=True, check=True)
+@pytest.fixture(scope="session")
+def _dvc_nogit_template(tmp_path_factory):
+    """Build a DVC-only (``--no-scm``) repo once per session, for ``dvc_workdir_nogit``."""
+    from dvc.repo import Repo
 
+    template = tmp_path_factory.mktemp("dvc_nogit_template")
+    Repo.init(str(template), no_scm=True).close()
+    return template
+
+
+def _workdir_from(template, tmp_path, monkeypatch):
+    shutil.copytree(template, tmp_path, symlinks=True, dirs_exist_ok=True)
+    monkeypatch.chdir(tmp_path)
     return tmp_path
 
 
-def test_cli_help(runner):
-    """Test CLI shows help."""
-    result = runner.invoke(cli, ["--help"])
-    assert result.exit_code == 0
+@pytest.fixture
+def dvc_workdir(tmp_path, _dvc_repo_template, monkeypatch):
+    """Copy the session's DVC repo template into ``tmp_path`` and ``cd`` there."""
+    return _workdir_from(_dvc_repo_template, tmp_path, monkeypatch)
+
+
+@pytest.fixture
+def dvc_workdir_nogit(tmp_path, _dvc_nogit_template, monkeypatch):
+    """Like ``dvc_workdir``, without git, for tests that never touch it."""
+    return _workdir_from(_dvc_nogit_template, tmp_path, monkeypatch)
 
-    help = parse_click_help(result.output)
+
+def test_cli_help():
+    """Test CLI shows help."""
+    help = parse_click_help(render_help())
     assert help.usage == "cli [OPTIONS] COMMAND [ARGS]..."
     assert help.description.startswith("DVX - Minimal data version control.")
     # Top-level CLI exposes these commands. Order is alphabetical via Click.
@@ -200,44 +252,30 @@ def test_cli_version(runner):
     assert re.match(r"^\d+\.\d+\.\d+", version.dvc), version.dvc
 
 
-def test_cache_help(runner):
+def test_cache_help():
     """Test cache subcommand help."""
-    result = runner.invoke(cli, ["cache", "--help"])
-    assert result.exit_code == 0
-
-    help = parse_click_help(result.output)
+    help = parse_click_help(render_help("cache"))
     assert help.usage == "cli cache [OPTIONS] COMMAND [ARGS]..."
     assert help.description.startswith("Manage DVC cache and inspect cached files.")
     assert set(help.commands) == {"dir", "md5", "path"}
 
 
-def test_cache_md5(runner, tmp_path):
+def test_cache_md5(runner, tmp_path, monkeypatch):
     """Test cache md5 command."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create .dvc file
     expected_hash = "abc123def456"
-    dvc_content = {
-        "outs": [
-            {
-                "md5": expected_hash,
-                "size": 100,
-                "path": "data.txt",
-            }
-        ]
-    }
-    dvc_file = tmp_path / "data.txt.dvc"
-    with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+    _write_dvc(tmp_path / "data.txt.dvc", expected_hash, 100, "data.txt")
 
-    result = runner.invoke(cli, ["cache", "md5", "data.txt"])
+    result = runner.invoke(cli, ["cache", "md5", "data.txt"], standalone_mode=False)
     assert result.exit_code == 0
     assert result.output.strip() == expected_hash
 
 
-def test_cache_path(runner, tmp_path):
+def test_cache_path(runner, tmp_path, monkeypatch):
     """Test cache path command."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create .dvc directory structure
     dvc_dir = tmp_path / ".dvc"
@@ -245,42 +283,27 @@ def test_cache_path(runner, tmp_path):
 
     # Create .dvc file
     md5_hash = "abc123def456789"
-    dvc_content = {
-        "outs": [
-            {
-                "md5": md5_hash,
-                "size": 100,
-                "path": "data.txt",
-            }
-        ]
-    }
-    dvc_file = tmp_path / "data.txt.dvc"
-    with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+    _write_dvc(tmp_path / "data.txt.dvc", md5_hash, 100, "data.txt")
 
-    result = runner.invoke(cli, ["cache", "path", "data.txt"])
+    result = runner.invoke(cli, ["cache", "path", "data.txt"], standalone_mode=False)
     assert result.exit_code == 0
     # DVC cache path structure: .dvc/cache/files/md5/<first2>/<rest>
     expected_path = f".dvc/cache/files/md5/{md5_hash[:2]}/{md5_hash[2:]}"
     assert result.output.strip() == expected_path
 
 
-def test_root_command(runner, temp_dvc_repo):
+def test_root_command(runner, dvc_workdir):
     """Test root command."""
-    os.chdir(temp_dvc_repo)
-
     result = runner.invoke(cli, ["root"])
     assert result.exit_code == 0
     # Root command outputs the repo root path - could be "." or absolute path
     output_path = result.output.strip()
-    assert output_path in (".", str(temp_dvc_repo))
+    assert output_path in (".", str(dvc_workdir))
 
 
-def test_run_help(runner):
+def test_run_help():
     """Test run command help."""
-    result = runner.invoke(cli, ["run", "--help"])
-    assert result.exit_code == 0
-    help = parse_click_help(result.output)
+    help = parse_click_help(render_help("run"))
     assert help.usage == "cli run [OPTIONS] [TARGETS]..."
     assert help.description.startswith("Execute artifact computations from .dvc files.")
     # The `run` command exposes these flags. Exact set match guards
@@ -292,9 +315,9 @@ def test_run_help(runner):
     }
 
 
-def test_run_no_dvc_files(runner, tmp_path):
+def test_run_no_dvc_files(runner, tmp_path, monkeypatch):
     """Test run command with no .dvc files."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     result = runner.invoke(cli, ["run"])
     assert result.exit_code != 0
@@ -305,28 +328,15 @@ def test_run_no_dvc_files(runner, tmp_path):
     ]
 
 
-def test_run_dry_run(runner, tmp_path):
+def test_run_dry_run(runner, tmp_path, monkeypatch):
     """Test run command with --dry-run."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create a simple .dvc file with computation
-    dvc_content = {
-        "outs": [
-            {
-                "md5": "",
-                "size": 0,
-                "path": "output.txt",
-            }
-        ],
-        "meta": {
-            "computation": {
-                "cmd": "echo hello > output.txt",
-            }
-        },
-    }
-    dvc_file = tmp_path / "output.txt.dvc"
-    with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+    _write_dvc(
+        tmp_path / "output.txt.dvc", "", 0, "output.txt",
+        computation={"cmd": "echo hello > output.txt"},
+    )
 
     result = runner.invoke(cli, ["run", "--dry-run"])
     assert result.exit_code == 0
@@ -348,27 +358,16 @@ def test_run_dry_run(runner, tmp_path):
     ]
 
 
-def test_cat_missing_cache(runner, tmp_path):
+def test_cat_missing_cache(runner, tmp_path, monkeypatch):
     """Test cat command with missing cache file."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create .dvc directory
     dvc_dir = tmp_path / ".dvc"
     dvc_dir.mkdir()
 
     # Create .dvc file
-    dvc_content = {
-        "outs": [
-            {
-                "md5": "abc123",
-                "size": 100,
-                "path": "data.txt",
-            }
-        ]
-    }
-    dvc_file = tmp_path / "data.txt.dvc"
-    with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+    _write_dvc(tmp_path / "data.txt.dvc", "abc123", 100, "data.txt")
 
     result = runner.invoke(cli, ["cat", "data.txt"])
     assert result.exit_code != 0
@@ -376,12 +375,14 @@ def test_cat_missing_cache(runner, tmp_path):
     assert result.output.startswith("Error: Cache file not found"), result.output
 
 
-def test_init_command(runner, tmp_path):
+def test_init_command(runner, tmp_path, monkeypatch):
     """Test init command."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Initialize git first
-    subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+    from dulwich import porcelain
+
+    porcelain.init(str(tmp_path)).close()
 
     result = runner.invoke(cli, ["init"])
     assert result.exit_code == 0
@@ -392,75 +393,56 @@ def test_init_command(runner, tmp_path):
     assert (tmp_path / ".dvc").exists()
 
 
-def test_add_command(runner, temp_dvc_repo):
+def test_add_command(runner, dvc_workdir):
     """Test add command."""
-    os.chdir(temp_dvc_repo)
-
     # Create a file to track
-    data_file = temp_dvc_repo / "data.txt"
+    data_file = dvc_workdir / "data.txt"
     data_file.write_text("test data\n")
 
     result = runner.invoke(cli, ["add", "data.txt"])
     assert result.exit_code == 0
 
     # Should create .dvc file
-    assert (temp_dvc_repo / "data.txt.dvc").exists()
+    assert (dvc_workdir / "data.txt.dvc").exists()
 
 
-def test_status_command(runner, temp_dvc_repo):
+def test_status_command(runner, dvc_workdir_nogit):
     """Test status command."""
-    os.chdir(temp_dvc_repo)
-
-    result = runner.invoke(cli, ["status"])
+    result = runner.invoke(cli, ["status"], standalone_mode=False)
     # Should succeed even with no tracked files
     assert result.exit_code == 0
 
 
-def test_diff_help(runner):
+def test_diff_help():
     """Test diff command help."""
-    result = runner.invoke(cli, ["diff", "--help"])
-    assert result.exit_code == 0
-    help = parse_click_help(result.output)
+    help = parse_click_help(render_help("diff"))
     assert help.usage == "cli diff [OPTIONS] [cmd...] <path>"
     assert help.description.startswith("Diff DVC-tracked files between commits.")
 
 
-def test_add_recursive_flag(runner, temp_dvc_repo):
+def test_add_recursive_flag(runner, dvc_workdir):
     """Test add command with --recursive flag."""
-    from dvx.cache import _hash_single_file
-
-    os.chdir(temp_dvc_repo)
-
     # Create dep file
-    dep_file = temp_dvc_repo / "input.txt"
+    dep_file = dvc_workdir / "input.txt"
     dep_file.write_text("input data\n")
-    dep_hash = _hash_single_file(dep_file)
+    dep_hash = _MD5["input data\n"]
 
     # Create dep .dvc with WRONG hash (stale)
-    dep_dvc = temp_dvc_repo / "input.txt.dvc"
-    dvc_content = {
-        "outs": [{"md5": "wrong_hash_123", "size": 10, "hash": "md5", "path": "input.txt"}]
-    }
-    with open(dep_dvc, "w") as f:
-        yaml.dump(dvc_content, f)
+    dep_dvc = dvc_workdir / "input.txt.dvc"
+    _write_dvc(dep_dvc, "wrong_hash_123", 10, "input.txt", hash_algo="md5")
 
     # Create output file
-    output_file = temp_dvc_repo / "output.txt"
+    output_file = dvc_workdir / "output.txt"
     output_file.write_text("output\n")
 
     # Create output .dvc with dep
-    output_dvc = temp_dvc_repo / "output.txt.dvc"
-    output_content = {
-        "outs": [{"md5": "placeholder", "size": 7, "path": "output.txt"}],
-        "meta": {
-            "computation": {
-                "cmd": "cat input.txt > output.txt",
-                "deps": {"input.txt": "wrong_hash_123"},
-            }
+    _write_dvc(
+        dvc_workdir / "output.txt.dvc", "placeholder", 7, "output.txt",
+        computation={
+            "cmd": "cat input.txt > output.txt",
+            "deps": {"input.txt": "wrong_hash_123"},
         },
-    }
-    with open(output_dvc, "w") as f:
-        yaml.dump(output_content, f)
+    )
 
     # Without -r, should fail with stale dep error
     stale_hash = "wrong_hash_123"
@@ -483,34 +465,21 @@ def test_add_recursive_flag(runner, temp_dvc_repo):
     assert dep_result["outs"][0]["md5"] == dep_hash
 
 
-def test_status_shows_fresh_and_stale(runner, temp_dvc_repo):
+def test_status_shows_fresh_and_stale(runner, dvc_workdir_nogit):
     """Test status command shows correct freshness indicators."""
-    from dvx.cache import _hash_single_file
-
-    os.chdir(temp_dvc_repo)
-
     # Create a fresh file (hash matches .dvc)
-    fresh_file = temp_dvc_repo / "fresh.txt"
+    fresh_file = dvc_workdir_nogit / "fresh.txt"
     fresh_file.write_text("fresh data\n")
-    fresh_hash = _hash_single_file(fresh_file)
+    fresh_hash = _MD5["fresh data\n"]
 
-    fresh_dvc = temp_dvc_repo / "fresh.txt.dvc"
-    with open(fresh_dvc, "w") as f:
-        yaml.dump({
-            "outs": [{"md5": fresh_hash, "size": 11, "hash": "md5", "path": "fresh.txt"}]
-        }, f)
+    _write_dvc(dvc_workdir_nogit / "fresh.txt.dvc", fresh_hash, 11, "fresh.txt", hash_algo="md5")
 
     # Create a stale file (hash doesn't match .dvc)
-    stale_file = temp_dvc_repo / "stale.txt"
+    stale_file = dvc_workdir_nogit / "stale.txt"
     stale_file.write_text("stale data\n")
-    stale_actual_hash = _hash_single_file(stale_file)
 
-    stale_dvc = temp_dvc_repo / "stale.txt.dvc"
     wrong_hash = "00000000000000000000000000000000"
-    with open(stale_dvc, "w") as f:
-        yaml.dump({
-            "outs": [{"md5": wrong_hash, "size": 11, "hash": "md5", "path": "stale.txt"}]
-        }, f)
+    _write_dvc(dvc_workdir_nogit / "stale.txt.dvc", wrong_hash, 11, "stale.txt", hash_algo="md5")
 
     result = runner.invoke(cli, ["status"])
     assert result.exit_code == 0
@@ -526,23 +495,14 @@ def test_status_shows_fresh_and_stale(runner, temp_dvc_repo):
     assert "data changed" in stale_line
 
 
-def test_status_json_output(runner, temp_dvc_repo):
+def test_status_json_output(runner, dvc_workdir_nogit):
     """Test status command with --json flag."""
-    import json
-    from dvx.cache import _hash_single_file
-
-    os.chdir(temp_dvc_repo)
-
     # Create a file and track it
-    data_file = temp_dvc_repo / "data.txt"
+    data_file = dvc_workdir_nogit / "data.txt"
     data_file.write_text("test data\n")
-    file_hash = _hash_single_file(data_file)
+    file_hash = _MD5["test data\n"]
 
-    dvc_file = temp_dvc_repo / "data.txt.dvc"
-    with open(dvc_file, "w") as f:
-        yaml.dump({
-            "outs": [{"md5": file_hash, "size": 10, "hash": "md5", "path": "data.txt"}]
-        }, f)
+    _write_dvc(dvc_workdir_nogit / "data.txt.dvc", file_hash, 10, "data.txt", hash_algo="md5")
 
     result = runner.invoke(cli, ["status", "--json", "-v"])
     assert result.exit_code == 0
@@ -552,40 +512,29 @@ def test_status_json_output(runner, temp_dvc_repo):
     ]
 
 
-def test_status_dep_changed(runner, temp_dvc_repo):
+def test_status_dep_changed(runner, dvc_workdir):
     """Test status shows dep changed vs data changed."""
-    from dvx.cache import _hash_single_file
-
-    os.chdir(temp_dvc_repo)
-
     # Create dep file and .dvc (fresh)
-    dep_file = temp_dvc_repo / "input.txt"
+    dep_file = dvc_workdir / "input.txt"
     dep_file.write_text("input\n")
-    dep_hash = _hash_single_file(dep_file)
+    dep_hash = _MD5["input\n"]
 
-    dep_dvc = temp_dvc_repo / "input.txt.dvc"
-    with open(dep_dvc, "w") as f:
-        yaml.dump({
-            "outs": [{"md5": dep_hash, "size": 6, "hash": "md5", "path": "input.txt"}]
-        }, f)
+    _write_dvc(dvc_workdir / "input.txt.dvc", dep_hash, 6, "input.txt", hash_algo="md5")
 
     # Create output file (fresh data)
-    output_file = temp_dvc_repo / "output.txt"
+    output_file = dvc_workdir / "output.txt"
     output_file.write_text("output\n")
-    output_hash = _hash_single_file(output_file)
+    output_hash = _MD5["output\n"]
 
     # Create output .dvc with WRONG dep hash (dep changed scenario)
-    output_dvc = temp_dvc_repo / "output.txt.dvc"
-    with open(output_dvc, "w") as f:
-        yaml.dump({
-            "outs": [{"md5": output_hash, "size": 7, "hash": "md5", "path": "output.txt"}],
-            "meta": {
-                "computation": {
-                    "cmd": "cat input.txt > output.txt",
-                    "deps": {"input.txt": "old_wrong_hash"},
-                }
-            }
-        }, f)
+    _write_dvc(
+        dvc_workdir / "output.txt.dvc", output_hash, 7, "output.txt",
+        hash_algo="md5",
+        computation={
+            "cmd": "cat input.txt > output.txt",
+            "deps": {"input.txt": "old_wrong_hash"},
+        },
+    )
 
     result = runner.invoke(cli, ["status"])
     assert result.exit_code == 0
@@ -599,9 +548,9 @@ def test_status_dep_changed(runner, temp_dvc_repo):
     )
 
 
-def test_run_discovers_dvc_files_recursively(runner, tmp_path):
+def test_run_discovers_dvc_files_recursively(runner, tmp_path, monkeypatch):
     """Test that `dvx run` with no targets finds .dvc files in subdirectories."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create .dvc files in nested subdirectories
     sub1 = tmp_path / "sub1"
@@ -610,13 +559,7 @@ def test_run_discovers_dvc_files_recursively(runner, tmp_path):
     sub2.mkdir()
 
     for d, name in [(tmp_path, "top.txt"), (sub1, "mid.txt"), (sub2, "deep.txt")]:
-        dvc_content = {
-            "outs": [{"md5": "", "size": 0, "path": name}],
-            "meta": {"computation": {"cmd": f"echo {name} > {name}"}},
-        }
-        dvc_file = d / f"{name}.dvc"
-        with open(dvc_file, "w") as f:
-            yaml.dump(dvc_content, f)
+        _write_dvc(d / f"{name}.dvc", "", 0, name, computation={"cmd": f"echo {name} > {name}"})
 
     # Also create a .dvc/config dir to make sure .dvc/ directory files are excluded
     dvc_dir = tmp_path / ".dvc"
@@ -632,9 +575,9 @@ def test_run_discovers_dvc_files_recursively(runner, tmp_path):
     assert set(discovered) == {"top.txt", "sub1/mid.txt", "sub1/sub2/deep.txt"}
 
 
-def test_status_transitive_staleness(runner, tmp_path):
+def test_status_transitive_staleness(runner, tmp_path, monkeypatch):
     """dvx status shows transitively stale stages with ⚠ icon."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create .dvc dir
     (tmp_path / ".dvc").mkdir()
@@ -647,33 +590,28 @@ def test_status_transitive_staleness(runner, tmp_path):
     output_a = tmp_path / "step_a.txt"
     output_a.write_text("result_a\n")
 
-    from dvx.run.hash import compute_md5
     a_md5 = compute_md5(output_a)
 
-    dvc_a = {
-        "outs": [{"md5": a_md5, "size": output_a.stat().st_size, "path": "step_a.txt"}],
-        "meta": {"computation": {
+    _write_dvc(
+        tmp_path / "step_a.txt.dvc", a_md5, output_a.stat().st_size, "step_a.txt",
+        computation={
             "cmd": "cat input.txt > step_a.txt",
             "deps": {"input.txt": "00000000000000000000000000000000"},  # Wrong hash → stale
-        }},
-    }
-    with open(tmp_path / "step_a.txt.dvc", "w") as f:
-        yaml.dump(dvc_a, f)
+        },
+    )
 
     # Stage B: depends on step_a.txt, output matches → directly fresh
     output_b = tmp_path / "step_b.txt"
     output_b.write_text("result_b\n")
     b_md5 = compute_md5(output_b)
 
-    dvc_b = {
-        "outs": [{"md5": b_md5, "size": output_b.stat().st_size, "path": "step_b.txt"}],
-        "meta": {"computation": {
+    _write_dvc(
+        tmp_path / "step_b.txt.dvc", b_md5, output_b.stat().st_size, "step_b.txt",
+        computation={
             "cmd": "cat step_a.txt > step_b.txt",
             "deps": {"step_a.txt": a_md5},  # Matches current → directly fresh
-        }},
-    }
-    with open(tmp_path / "step_b.txt.dvc", "w") as f:
-        yaml.dump(dvc_b, f)
+        },
+    )
 
     result = runner.invoke(cli, ["status", "-v"])
     assert result.exit_code == 0
@@ -689,28 +627,23 @@ def test_status_transitive_staleness(runner, tmp_path):
 
 
 @pytest.fixture
-def mixed_status_repo(tmp_path):
+def mixed_status_repo(tmp_path, monkeypatch):
     """Repo with one stale, one missing, one fresh .dvc file."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     (tmp_path / ".dvc").mkdir()
 
-    from dvx.run.hash import compute_md5
-
     # Fresh
     f = tmp_path / "fresh.txt"
     f.write_text("fresh\n")
-    with open(tmp_path / "fresh.txt.dvc", "w") as fp:
-        yaml.dump({"outs": [{"md5": compute_md5(f), "size": f.stat().st_size, "path": "fresh.txt"}]}, fp)
+    _write_dvc(tmp_path / "fresh.txt.dvc", compute_md5(f), f.stat().st_size, "fresh.txt")
 
     # Stale
     s = tmp_path / "stale.txt"
     s.write_text("stale\n")
-    with open(tmp_path / "stale.txt.dvc", "w") as fp:
-        yaml.dump({"outs": [{"md5": "0" * 32, "size": 5, "path": "stale.txt"}]}, fp)
+    _write_dvc(tmp_path / "stale.txt.dvc", "0" * 32, 5, "stale.txt")
 
     # Missing
-    with open(tmp_path / "missing.txt.dvc", "w") as fp:
-        yaml.dump({"outs": [{"md5": "1" * 32, "size": 10, "path": "missing.txt"}]}, fp)
+    _write_dvc(tmp_path / "missing.txt.dvc", "1" * 32, 10, "missing.txt")
 
     return tmp_path
 
@@ -788,7 +721,6 @@ def test_status_unknown_status(runner, mixed_status_repo):
 
 def test_status_json_respects_filter(runner, mixed_status_repo):
     """JSON output respects -s filter."""
-    import json
     result = runner.invoke(cli, ["status", "-s", "stale", "--json"])
     assert result.exit_code == 0
     data = json.loads(result.output)
@@ -63,7 +63,7 @@ def test_parse_config_file(tmp_path):
         }
     }
     with open(config_file, "w") as f:
-        yaml.dump(config_data, f)
+        f.write(yaml.dump(config_data))
 
     config = _parse_config(config_file)
 
@@ -79,7 +79,7 @@ def test_load_config_dvx_dir(tmp_path):
     dvx_dir.mkdir()
     config_file = dvx_dir / "config.yml"
     with open(config_file, "w") as f:
-        yaml.dump({"run": {"push": "end"}}, f)
+        f.write(yaml.dump({"run": {"push": "end"}}))
 
     # Also need .dvc dir for repo root detection
     (tmp_path / ".dvc").mkdir()
@@ -92,7 +92,7 @@ def test_load_config_dvx_yml(tmp_path):
     """load_config finds dvx.yml in repo root."""
     config_file = tmp_path / "dvx.yml"
     with open(config_file, "w") as f:
-        yaml.dump({"run": {"commit": "always"}}, f)
+        f.write(yaml.dump({"run": {"commit": "always"}}))
 
     (tmp_path / ".dvc").mkdir()
 
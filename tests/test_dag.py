@@ -0,0 +1,34 @@
+"""Tests for dvx.cli.dag."""
+
+from dvx.cli.dag import DagNode, DependencyGraph
+
+
+def _graph(deps: dict[str, list[str]]) -> DependencyGraph:
+    graph = DependencyGraph()
+    for path, node_deps in deps.items():
+        graph.add_node(DagNode(path=path, dvc_path=f"{path}.dvc", deps=dict.fromkeys(node_deps, "md5")))
+    return graph
+
+
+def test_topological_sort_chain():
+    """Deps come before dependents."""
+    graph = _graph({"c": ["b"], "b": ["a"], "a": []})
+    assert graph.topological_sort() == ["a", "b", "c"]
+
+
+def test_topological_sort_ignores_external_deps():
+    """Deps without a .dvc node (raw inputs) don't hold back their dependents."""
+    graph = _graph({"out": ["raw.csv", "mid"], "mid": ["raw.csv"]})
+    assert graph.topological_sort() == ["mid", "out"]
+
+
+def test_topological_sort_diamond_is_deterministic():
+    """Among ready nodes, the smallest path is emitted first."""
+    graph = _graph({"top": ["right", "left"], "right": ["root"], "left": ["root"], "root": []})
+    assert graph.topological_sort() == ["root", "left", "right", "top"]
+
+
+def test_topological_sort_omits_cycles():
+    """Nodes on (or downstream of) a cycle never become ready."""
+    graph = _graph({"a": [], "b": ["a", "c"], "c": ["b"], "d": ["c"]})
+    assert graph.topological_sort() == ["a"]
@@ -7,7 +7,6 @@ Assertions parse CLI output into structured form and use exact equality
 where shape is fixed; substring ``in`` checks are avoided.
 """
 
-import os
 import subprocess
 from pathlib import Path
 
@@ -41,30 +40,15 @@ from dvx.cli import cli
 # ────────────────────────────────────────────────────────────────────────────
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
     return CliRunner()
 
 
 @pytest.fixture
-def dvc_repo_with_remote(tmp_path):
+def dvc_repo_with_remote(git_dvc_repo_with_remote):
     """Initialize a git+dvc repo with a local remote."""
-    repo_path = tmp_path / "repo"
-    remote_path = tmp_path / "remote"
-    repo_path.mkdir()
-    remote_path.mkdir()
-
-    def run(*args):
-        subprocess.run(args, cwd=repo_path, capture_output=True, check=True)
-
-    run("git", "init")
-    run("git", "config", "user.email", "test@test.com")
-    run("git", "config", "user.name", "Test")
-    run("dvc", "init")
-    run("dvc", "remote", "add", "-d", "local", str(remote_path))
-    run("git", "add", ".")
-    run("git", "commit", "-m", "init")
-    return repo_path, remote_path
+    return git_dvc_repo_with_remote
 
 
 @pytest.fixture
@@ -75,7 +59,10 @@ def two_commits(dvc_repo_with_remote):
     repo_path, remote_path = dvc_repo_with_remote
 
     def run(*args):
-        subprocess.run(args, cwd=repo_path, capture_output=True, check=True)
+        subprocess.run(
+            args, cwd=repo_path, check=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
 
     def rev(spec):
         return subprocess.run(
@@ -114,7 +101,10 @@ def git_tracked_two_commits(dvc_repo_with_remote):
     repo_path, _remote = dvc_repo_with_remote
 
     def run(*args):
-        subprocess.run(args, cwd=repo_path, capture_output=True, check=True)
+        subprocess.run(
+            args, cwd=repo_path, check=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
 
     def rev(spec):
         return subprocess.run(
@@ -191,12 +181,9 @@ def _evict(repo_path: Path, md5: str) -> None:
 
 
 def _run_diff_in(repo_path: Path, runner: CliRunner, *args):
-    cwd = os.getcwd()
-    os.chdir(repo_path)
-    try:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(repo_path)
         return runner.invoke(cli, ["diff", *args])
-    finally:
-        os.chdir(cwd)
 
 
 class TestDiffPull:
@@ -323,7 +310,10 @@ class TestDiffGitTracked:
         repo_path, _remote = dvc_repo_with_remote
 
         def run(*args):
-            subprocess.run(args, cwd=repo_path, capture_output=True, check=True)
+            subprocess.run(
+                args, cwd=repo_path, check=True,
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            )
 
         def rev(spec):
             return subprocess.run(
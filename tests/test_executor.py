@@ -1,14 +1,15 @@
 """Tests for parallel executor, including multi-output deduplication."""
 
-import subprocess
 from io import StringIO
 from pathlib import Path
 
 import pytest
 import yaml
+from dvc.repo import Repo
 
 from dvx.run.artifact import Artifact, Computation
 from dvx.run.executor import ExecutionConfig, ParallelExecutor, _group_into_levels, run
+from tests.yaml_util import dump_yaml
 
 
 @pytest.fixture
@@ -18,57 +19,85 @@ def tmp_workdir(tmp_path, monkeypatch):
     return tmp_path
 
 
-def test_multi_output_deduplication(tmp_workdir):
-    """Test that multiple outputs with same cmd only run the command once."""
-    # Create a script that writes to two files and increments a counter
-    counter_file = tmp_workdir / "counter.txt"
-    counter_file.write_text("0")
-    output1_path = tmp_workdir / "output1.txt"
-    output2_path = tmp_workdir / "output2.txt"
+# Shared cmds for output1.txt + output2.txt. Each bumps a counter, so tests can
+# check the cmd ran once; they run under the executor's own `sh` and use
+# absolute paths to avoid working directory issues in CI.
+_BUMP = "read count < {counter}; echo $((count + 1)) > {counter}; "
+_CMD_BOTH = _BUMP + 'echo "output1" > {out1}; echo "output2" > {out2}'
+# Intentionally not creating output2.txt
+_CMD_PARTIAL = _BUMP + 'echo "output1" > {out1}'
+_CMD_FAIL = _BUMP + "exit 1"
 
-    script = tmp_workdir / "multi_output.sh"
-    # Use absolute paths to avoid working directory issues in CI
-    script.write_text(f"""#!/bin/bash
-count=$(cat {counter_file})
-echo $((count + 1)) > {counter_file}
-echo "output1" > {output1_path}
-echo "output2" > {output2_path}
-""")
-    script.chmod(0o755)
 
-    cmd = f"bash {script}"
+@pytest.fixture
+def two_output_run(tmp_workdir, request):
+    """Run two artifacts (output1.txt, output2.txt) sharing the cmd template ``request.param``.
+
+    Returns ``(results, counter_file, log_output)``.
+    """
+    counter_file = tmp_workdir / "counter.txt"
+    counter_file.write_text("0")
+    out1 = str(tmp_workdir / "output1.txt")
+    out2 = str(tmp_workdir / "output2.txt")
+    cmd = request.param.format(counter=counter_file, out1=out1, out2=out2)
 
     # Create two artifacts with the same command
-    artifact1 = Artifact(
-        path=str(tmp_workdir / "output1.txt"),
-        computation=Computation(cmd=cmd, deps=[]),
-    )
-    artifact2 = Artifact(
-        path=str(tmp_workdir / "output2.txt"),
-        computation=Computation(cmd=cmd, deps=[]),
-    )
+    artifact1 = Artifact(path=out1, computation=Computation(cmd=cmd, deps=[]))
+    artifact2 = Artifact(path=out2, computation=Computation(cmd=cmd, deps=[]))
 
-    # Execute both
     output = StringIO()
+    # Use max_workers=2 to test parallel execution
     config = ExecutionConfig(max_workers=2)
-    executor = ParallelExecutor([artifact1, artifact2], config, output)
-    results = executor.execute()
+    results = ParallelExecutor([artifact1, artifact2], config, output).execute()
+    return results, counter_file, output.getvalue()
+
+
+@pytest.mark.parametrize(
+    "two_output_run, expected_success, failure_reasons",
+    [
+        # Multiple outputs with same cmd only run the command once
+        pytest.param(_CMD_BOTH, {"output1.txt": True, "output2.txt": True}, (), id="dedup"),
+        # Command succeeds but doesn't produce all outputs
+        pytest.param(
+            _CMD_PARTIAL,
+            {"output1.txt": True, "output2.txt": False},
+            ("not created", "not produced"),
+            id="partial_failure",
+        ),
+        # The shared command fails
+        pytest.param(
+            _CMD_FAIL,
+            {"output1.txt": False, "output2.txt": False},
+            ("failed",),
+            id="command_failure",
+        ),
+    ],
+    indirect=["two_output_run"],
+)
+def test_multi_output_shared_cmd(two_output_run, expected_success, failure_reasons):
+    """Co-outputs of one cmd: it runs once, and each output's result reflects what it produced."""
+    results, counter_file, log_output = two_output_run
 
-    # Check results
     assert len(results) == 2
-    assert all(r.success for r in results)
+    assert {Path(r.path).name: r.success for r in results} == expected_success
 
     # Key assertion: command should have run only once
-    assert counter_file.read_text().strip() == "1"
+    assert counter_file.read_text().strip() == "1", "Command should run exactly once"
 
-    # Both outputs should exist
-    assert (tmp_workdir / "output1.txt").read_text().strip() == "output1"
-    assert (tmp_workdir / "output2.txt").read_text().strip() == "output2"
+    failures = [r for r in results if not r.success]
+    if failures:
+        assert any(s in r.reason for r in failures for s in failure_reasons), [
+            r.reason for r in failures
+        ]
+    else:
+        # Both outputs should exist
+        workdir = counter_file.parent
+        assert (workdir / "output1.txt").read_text().strip() == "output1"
+        assert (workdir / "output2.txt").read_text().strip() == "output2"
 
-    # Check logs show deduplication
-    log_output = output.getvalue()
-    assert "running..." in log_output
-    assert "co-output ready" in log_output or "waiting" in log_output
+        # Check logs show deduplication
+        assert "running..." in log_output
+        assert "co-output ready" in log_output or "waiting" in log_output
 
 
 def test_multi_output_different_deps(tmp_workdir):
@@ -78,15 +107,10 @@ def test_multi_output_different_deps(tmp_workdir):
     input2 = tmp_workdir / "input2.txt"
     input1.write_text("data1")
     input2.write_text("data2")
+    out1 = str(tmp_workdir / "output1.txt")
+    out2 = str(tmp_workdir / "output2.txt")
 
-    script = tmp_workdir / "multi_output.sh"
-    script.write_text("""#!/bin/bash
-echo "output1" > output1.txt
-echo "output2" > output2.txt
-""")
-    script.chmod(0o755)
-
-    cmd = f"bash {script}"
+    cmd = 'echo "output1" > output1.txt; echo "output2" > output2.txt'
 
     # Create leaf artifacts for inputs (no computation)
     leaf1 = Artifact(path=str(input1))
@@ -94,14 +118,14 @@ echo "output2" > output2.txt
 
     # Create artifacts with same cmd but different deps
     artifact1 = Artifact(
-        path=str(tmp_workdir / "output1.txt"),
+        path=out1,
         computation=Computation(
             cmd=cmd,
             deps=[leaf1],
         ),
     )
     artifact2 = Artifact(
-        path=str(tmp_workdir / "output2.txt"),
+        path=out2,
         computation=Computation(
             cmd=cmd,
             deps=[leaf2],
@@ -119,8 +143,8 @@ echo "output2" > output2.txt
     assert all(r.success for r in computed_results)
 
     # Check that .dvc files have different deps
-    dvc1 = yaml.safe_load((tmp_workdir / "output1.txt.dvc").read_text())
-    dvc2 = yaml.safe_load((tmp_workdir / "output2.txt.dvc").read_text())
+    dvc1 = yaml.safe_load(Path(out1 + ".dvc").read_text())
+    dvc2 = yaml.safe_load(Path(out2 + ".dvc").read_text())
 
     deps1 = dvc1["meta"]["computation"]["deps"]
     deps2 = dvc2["meta"]["computation"]["deps"]
@@ -130,54 +154,6 @@ echo "output2" > output2.txt
     assert "input2.txt" in str(deps2)
 
 
-def test_multi_output_partial_failure(tmp_workdir):
-    """Test handling when command succeeds but doesn't produce all outputs."""
-    # Track how many times the script runs
-    counter_file = tmp_workdir / "counter.txt"
-    counter_file.write_text("0")
-
-    output1_path = tmp_workdir / "output1.txt"
-    script = tmp_workdir / "partial.sh"
-    # Use absolute paths to avoid working directory issues
-    script.write_text(f"""#!/bin/bash
-count=$(cat {counter_file})
-echo $((count + 1)) > {counter_file}
-echo "output1" > {output1_path}
-# Intentionally not creating output2.txt
-""")
-    script.chmod(0o755)
-
-    cmd = f"bash {script}"
-
-    artifact1 = Artifact(
-        path=str(tmp_workdir / "output1.txt"),
-        computation=Computation(cmd=cmd, deps=[]),
-    )
-    artifact2 = Artifact(
-        path=str(tmp_workdir / "output2.txt"),
-        computation=Computation(cmd=cmd, deps=[]),
-    )
-
-    output = StringIO()
-    # Use max_workers=2 to test parallel execution
-    config = ExecutionConfig(max_workers=2)
-    executor = ParallelExecutor([artifact1, artifact2], config, output)
-    results = executor.execute()
-
-    # Command should run exactly once
-    assert counter_file.read_text().strip() == "1", "Command should run exactly once"
-
-    # One should succeed (output1.txt), one should fail (output2.txt not produced)
-    successes = [r for r in results if r.success]
-    failures = [r for r in results if not r.success]
-
-    assert len(successes) == 1, f"Expected 1 success, got {len(successes)}: {successes}"
-    assert len(failures) == 1, f"Expected 1 failure, got {len(failures)}: {failures}"
-    assert "output1.txt" in successes[0].path
-    assert "output2.txt" in failures[0].path
-    assert "not created" in failures[0].reason or "not produced" in failures[0].reason
-
-
 def test_cross_level_co_output_does_not_deadlock(tmp_workdir):
     """Co-outputs of one cmd that end up in different levels must not deadlock.
 
@@ -191,14 +167,7 @@ def test_cross_level_co_output_does_not_deadlock(tmp_workdir):
     matched hccs/path's ``path-data months`` outputs (see 2026-06-19+
     daily-update runs that hung at 6h GHA timeout).
     """
-    script = tmp_workdir / "multi.sh"
-    script.write_text(
-        "#!/bin/bash\n"
-        "echo l1 > a.txt\n"
-        "echo l2 > b.txt\n"
-    )
-    script.chmod(0o755)
-    cmd = f"bash {script}"
+    cmd = "echo l1 > a.txt; echo l2 > b.txt"
 
     # a.txt: no deps → Level 1. b.txt: dep on a.txt → Level 2. Same cmd.
     a = Artifact(path="a.txt", computation=Computation(cmd=cmd, deps=[]))
@@ -231,31 +200,6 @@ def test_cross_level_co_output_does_not_deadlock(tmp_workdir):
     assert all(r.success for r in results), [r.reason for r in results]
 
 
-def test_multi_output_command_failure(tmp_workdir):
-    """Test handling when the shared command fails."""
-    cmd = "exit 1"
-
-    artifact1 = Artifact(
-        path=str(tmp_workdir / "output1.txt"),
-        computation=Computation(cmd=cmd, deps=[]),
-    )
-    artifact2 = Artifact(
-        path=str(tmp_workdir / "output2.txt"),
-        computation=Computation(cmd=cmd, deps=[]),
-    )
-
-    output = StringIO()
-    config = ExecutionConfig(max_workers=2)
-    executor = ParallelExecutor([artifact1, artifact2], config, output)
-    results = executor.execute()
-
-    # Both should fail
-    assert all(not r.success for r in results)
-    # At least one should mention "co-output" (the waiter)
-    reasons = [r.reason for r in results]
-    assert any("failed" in r for r in reasons)
-
-
 def test_external_dep_no_circular_dependency(tmp_workdir):
     """Test that deps without .dvc files don't cause 'Circular dependency detected'.
 
@@ -279,7 +223,7 @@ def test_external_dep_no_circular_dependency(tmp_workdir):
         },
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     # This should NOT raise "Circular dependency detected"
     output = StringIO()
@@ -306,6 +250,27 @@ def test_group_into_levels_with_external_deps():
     assert levels[1] == [computed]
 
 
+def test_group_into_levels_diamond():
+    """Each artifact lands one level after its deepest dep; levels keep input order."""
+    root = Artifact(path="root.txt")
+    left = Artifact(path="left.txt", computation=Computation(cmd="l", deps=[root]))
+    right = Artifact(path="right.txt", computation=Computation(cmd="r", deps=["root.txt"]))
+    top = Artifact(path="top.txt", computation=Computation(cmd="t", deps=[right, left, root]))
+
+    levels = _group_into_levels([root, right, left, top])
+
+    assert levels == [[root], [right, left], [top]]
+
+
+def test_group_into_levels_unsatisfiable_dep_raises():
+    """A dep that's never scheduled (cycle or missing artifact) is an error."""
+    a = Artifact(path="a.txt", computation=Computation(cmd="a", deps=["b.txt"]))
+    b = Artifact(path="b.txt", computation=Computation(cmd="b", deps=[a]))
+
+    with pytest.raises(RuntimeError, match="Circular dependency"):
+        _group_into_levels([a, b])
+
+
 def test_group_into_levels_with_git_deps():
     """Test _group_into_levels handles git_deps as dependencies."""
     git_dep = Artifact(path="script.py")
@@ -340,7 +305,7 @@ def test_run_with_git_deps_in_dvc_file(tmp_workdir):
         },
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     # Should not raise "Circular dependency detected"
     output = StringIO()
@@ -435,14 +400,12 @@ def test_env_vars_are_set(tmp_workdir):
     assert commit_val != summary_val, "Commit and summary files should be different paths"
 
 
-def test_run_caches_output_blob(tmp_path):
+def test_run_caches_output_blob(tmp_path, monkeypatch):
     """dvx run copies output blobs to local cache so historical versions persist."""
-    import os
-
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Initialize a DVC repo (need .dvc dir for cache_blob)
-    subprocess.run(["dvc", "init", "--no-scm"], cwd=tmp_path, capture_output=True, check=True)
+    Repo.init(str(tmp_path), no_scm=True).close()
 
     output = tmp_path / "result.txt"
     artifact = Artifact(
@@ -564,12 +527,10 @@ def test_run_no_prune_fresh_walks_full_chain(tmp_workdir):
     assert paths == {str(a_pqt), str(b_pq)}
 
 
-def test_run_cache_idempotent(tmp_path):
+def test_run_cache_idempotent(tmp_path, monkeypatch):
     """Caching is idempotent — re-running doesn't error if blob already cached."""
-    import os
-
-    os.chdir(tmp_path)
-    subprocess.run(["dvc", "init", "--no-scm"], cwd=tmp_path, capture_output=True, check=True)
+    monkeypatch.chdir(tmp_path)
+    Repo.init(str(tmp_path), no_scm=True).close()
 
     output = tmp_path / "data.txt"
     artifact = Artifact(
@@ -1,6 +1,5 @@
 """Tests for dvx.gc module."""
 
-import os
 import subprocess
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -67,8 +66,6 @@ def git_repo_with_versions(tmp_path):
     repo.mkdir()
 
     subprocess.run(["git", "init"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.name", "Test"], cwd=repo, capture_output=True, check=True)
 
     # Create .dvc dir
     (repo / ".dvc").mkdir()
@@ -76,21 +73,21 @@ def git_repo_with_versions(tmp_path):
     # Version 1
     dvc_content = {"outs": [{"md5": "aaaa1111bbbb2222cccc3333dddd4444", "size": 100, "path": "data.txt"}]}
     with open(repo / "data.txt.dvc", "w") as f:
-        yaml.dump(dvc_content, f)
+        f.write(yaml.dump(dvc_content))
     subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
     subprocess.run(["git", "commit", "-m", "v1"], cwd=repo, capture_output=True, check=True)
 
     # Version 2
     dvc_content["outs"][0]["md5"] = "eeee5555ffff6666aaaa7777bbbb8888"
     with open(repo / "data.txt.dvc", "w") as f:
-        yaml.dump(dvc_content, f)
+        f.write(yaml.dump(dvc_content))
     subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
     subprocess.run(["git", "commit", "-m", "v2"], cwd=repo, capture_output=True, check=True)
 
     # Version 3
     dvc_content["outs"][0]["md5"] = "cccc9999dddd0000eeee1111ffff2222"
     with open(repo / "data.txt.dvc", "w") as f:
-        yaml.dump(dvc_content, f)
+        f.write(yaml.dump(dvc_content))
     subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
     subprocess.run(["git", "commit", "-m", "v3"], cwd=repo, capture_output=True, check=True)
 
@@ -117,10 +114,10 @@ def test_get_referenced_hashes(git_repo_with_versions):
     assert hashes == {"cccc9999dddd0000eeee1111ffff2222"}
 
 
-def test_compute_gc_plan_keep(git_repo_with_versions):
+def test_compute_gc_plan_keep(git_repo_with_versions, monkeypatch):
     """--keep N retains the N newest versions."""
     repo = git_repo_with_versions
-    os.chdir(repo)
+    monkeypatch.chdir(repo)
 
     # Create cache blobs for all 3 versions
     cache_dir = repo / ".dvc" / "cache" / "files" / "md5"
@@ -144,10 +141,10 @@ def test_compute_gc_plan_keep(git_repo_with_versions):
     assert len(deletable) == 1
 
 
-def test_compute_gc_plan_no_flags(git_repo_with_versions):
+def test_compute_gc_plan_no_flags(git_repo_with_versions, monkeypatch):
     """No --keep/--older-than: keep only HEAD-referenced hashes."""
     repo = git_repo_with_versions
-    os.chdir(repo)
+    monkeypatch.chdir(repo)
 
     cache_dir = repo / ".dvc" / "cache" / "files" / "md5"
     for md5 in [
@@ -170,10 +167,10 @@ def test_compute_gc_plan_no_flags(git_repo_with_versions):
     assert len(deletable) == 2
 
 
-def test_compute_gc_plan_older_than(git_repo_with_versions):
+def test_compute_gc_plan_older_than(git_repo_with_versions, monkeypatch):
     """--older-than retains versions newer than the cutoff."""
     repo = git_repo_with_versions
-    os.chdir(repo)
+    monkeypatch.chdir(repo)
 
     cache_dir = repo / ".dvc" / "cache" / "files" / "md5"
     for md5 in [
@@ -204,10 +201,10 @@ def test_compute_gc_plan_older_than(git_repo_with_versions):
     }
 
 
-def test_compute_gc_plan_keep_and_older_than(git_repo_with_versions):
+def test_compute_gc_plan_keep_and_older_than(git_repo_with_versions, monkeypatch):
     """--keep and --older-than combine: keep if EITHER criterion matches."""
     repo = git_repo_with_versions
-    os.chdir(repo)
+    monkeypatch.chdir(repo)
 
     cache_dir = repo / ".dvc" / "cache" / "files" / "md5"
     for md5 in [
@@ -227,10 +224,10 @@ def test_compute_gc_plan_keep_and_older_than(git_repo_with_versions):
     assert len(deletable) == 0
 
 
-def test_compute_gc_plan_target_specific(git_repo_with_versions):
+def test_compute_gc_plan_target_specific(git_repo_with_versions, monkeypatch):
     """GC targeting a specific .dvc file only considers that artifact."""
     repo = git_repo_with_versions
-    os.chdir(repo)
+    monkeypatch.chdir(repo)
 
     cache_dir = repo / ".dvc" / "cache" / "files" / "md5"
     for md5 in [
@@ -254,20 +251,18 @@ def test_compute_gc_plan_target_specific(git_repo_with_versions):
     assert len(deletable) == 2
 
 
-def test_compute_gc_plan_all_branches(tmp_path):
+def test_compute_gc_plan_all_branches(tmp_path, monkeypatch):
     """--all-branches considers hashes from all local branches."""
     repo = tmp_path / "repo"
     repo.mkdir()
 
     subprocess.run(["git", "init", "-b", "main"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.email", "t@t.com"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.name", "T"], cwd=repo, capture_output=True, check=True)
     (repo / ".dvc").mkdir()
 
     # Main branch: hash A
     dvc = {"outs": [{"md5": "aaaa1111bbbb2222cccc3333dddd4444", "size": 100, "path": "data.txt"}]}
     with open(repo / "data.txt.dvc", "w") as f:
-        yaml.dump(dvc, f)
+        f.write(yaml.dump(dvc))
     subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
     subprocess.run(["git", "commit", "-m", "main"], cwd=repo, capture_output=True, check=True)
 
@@ -275,12 +270,12 @@ def test_compute_gc_plan_all_branches(tmp_path):
     subprocess.run(["git", "checkout", "-b", "feat"], cwd=repo, capture_output=True, check=True)
     dvc["outs"][0]["md5"] = "bbbb2222cccc3333dddd4444eeee5555"
     with open(repo / "data.txt.dvc", "w") as f:
-        yaml.dump(dvc, f)
+        f.write(yaml.dump(dvc))
     subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
     subprocess.run(["git", "commit", "-m", "feat"], cwd=repo, capture_output=True, check=True)
 
     subprocess.run(["git", "checkout", "main"], cwd=repo, capture_output=True, check=True)
-    os.chdir(repo)
+    monkeypatch.chdir(repo)
 
     # Create cache for both
     cache_dir = repo / ".dvc" / "cache" / "files" / "md5"
@@ -305,29 +300,22 @@ def test_compute_gc_plan_all_branches(tmp_path):
     assert len(deletable) == 0
 
 
-def test_gc_cli_dry_run(tmp_path):
+def test_gc_cli_dry_run(tmp_path, monkeypatch, init_git_dvc_repo):
     """CLI dvx gc --keep --dry shows plan without deleting."""
     from click.testing import CliRunner
     from dvx.cli import cli
 
-    repo = tmp_path / "repo"
-    repo.mkdir()
-
-    subprocess.run(["git", "init"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.email", "t@t.com"], cwd=repo, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.name", "T"], cwd=repo, capture_output=True, check=True)
-
-    subprocess.run(["dvc", "init"], cwd=repo, capture_output=True, check=True)
+    repo = init_git_dvc_repo(tmp_path / "repo")
 
     dvc = {"outs": [{"md5": "aaaa1111bbbb2222cccc3333dddd4444", "size": 100, "path": "d.txt"}]}
     with open(repo / "d.txt.dvc", "w") as f:
-        yaml.dump(dvc, f)
+        f.write(yaml.dump(dvc))
     subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
     subprocess.run(["git", "commit", "-m", "v1"], cwd=repo, capture_output=True, check=True)
 
     dvc["outs"][0]["md5"] = "bbbb2222cccc3333dddd4444eeee5555"
     with open(repo / "d.txt.dvc", "w") as f:
-        yaml.dump(dvc, f)
+        f.write(yaml.dump(dvc))
     subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
     subprocess.run(["git", "commit", "-m", "v2"], cwd=repo, capture_output=True, check=True)
 
@@ -338,7 +326,7 @@ def test_gc_cli_dry_run(tmp_path):
         d.mkdir(parents=True, exist_ok=True)
         (d / md5[2:]).write_text("data")
 
-    os.chdir(repo)
+    monkeypatch.chdir(repo)
     runner = CliRunner()
     result = runner.invoke(cli, ["gc", "--keep", "1", "--dry"])
     assert result.exit_code == 0
@@ -25,27 +25,14 @@ from dvx.run.dvc_files import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
     return CliRunner()
 
 
 @pytest.fixture
-def repo_with_remote(tmp_path, monkeypatch):
-    repo = tmp_path / "repo"
-    remote = tmp_path / "remote"
-    repo.mkdir()
-    remote.mkdir()
-    for cmd in (
-        ["git", "init", "-b", "main"],
-        ["git", "config", "user.email", "t@t"],
-        ["git", "config", "user.name", "t"],
-        ["dvc", "init"],
-        ["dvc", "remote", "add", "-d", "local", str(remote)],
-        ["git", "add", "."],
-        ["git", "commit", "-m", "init"],
-    ):
-        subprocess.run(cmd, cwd=repo, check=True, capture_output=True)
+def repo_with_remote(git_dvc_repo_with_remote, monkeypatch):
+    repo, remote = git_dvc_repo_with_remote
     monkeypatch.chdir(repo)
     return repo, remote
 
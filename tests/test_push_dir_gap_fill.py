@@ -18,30 +18,15 @@ from click.testing import CliRunner
 from dvx.cli import cli
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
     return CliRunner()
 
 
 @pytest.fixture
-def repo_with_remote(tmp_path, monkeypatch):
+def repo_with_remote(git_dvc_repo_with_remote, monkeypatch):
     """DVC+git repo with a local remote at ``remote/``."""
-    repo = tmp_path / "repo"
-    remote = tmp_path / "remote"
-    repo.mkdir()
-    remote.mkdir()
-
-    for cmd in (
-        ["git", "init", "-b", "main"],
-        ["git", "config", "user.email", "t@t"],
-        ["git", "config", "user.name", "t"],
-        ["dvc", "init"],
-        ["dvc", "remote", "add", "-d", "local", str(remote)],
-        ["git", "add", "."],
-        ["git", "commit", "-m", "init"],
-    ):
-        subprocess.run(cmd, cwd=repo, check=True, capture_output=True)
-
+    repo, remote = git_dvc_repo_with_remote
     monkeypatch.chdir(repo)
     return repo, remote
 
@@ -50,7 +35,7 @@ def _write_stage(repo: Path, name: str, cmd: str) -> Path:
     """Write a .dvc file whose cmd produces ``name``. Returns the .dvc path."""
     dvc_path = repo / f"{name}.dvc"
     with open(dvc_path, "w") as f:
-        yaml.dump({"outs": [{"path": name}], "meta": {"computation": {"cmd": cmd}}}, f)
+        f.write(yaml.dump({"outs": [{"path": name}], "meta": {"computation": {"cmd": cmd}}}))
     return dvc_path
 
 
@@ -1,12 +1,12 @@
 """Tests for dvx.run.artifact module."""
 
-import os
 from pathlib import Path
 
 import pytest
 import yaml
 
 from dvx.run.artifact import Artifact, Computation, delayed, materialize, write_all_dvc
+from tests.yaml_util import dump_yaml
 
 
 def test_artifact_basic(tmp_path):
@@ -73,7 +73,7 @@ def test_artifact_from_dvc(tmp_path):
         },
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     artifact = Artifact.from_dvc(tmp_path / "output.txt")
 
@@ -112,6 +112,50 @@ def test_artifact_write_dvc(tmp_path):
     assert data["meta"]["computation"]["cmd"] == "echo test > output.txt"
 
 
+@pytest.mark.parametrize("cpus", [1, 4])
+def test_write_all_dvc_with_chain(tmp_path, monkeypatch, cpus):
+    """Computed artifacts in a chain are written leaves-first, serially or on a pool."""
+    import os
+
+    monkeypatch.setattr(os, "cpu_count", lambda: cpus)
+    raw = Artifact(path=str(tmp_path / "raw.txt"), md5="raw_hash")
+    mid = Artifact(
+        path=str(tmp_path / "mid.txt"),
+        computation=Computation(cmd="process raw.txt", deps=[raw]),
+    )
+    top = Artifact(
+        path=str(tmp_path / "top.txt"),
+        computation=Computation(cmd="process mid.txt", deps=[mid]),
+    )
+
+    paths = write_all_dvc([top])
+
+    assert paths == [tmp_path / "mid.txt.dvc", tmp_path / "top.txt.dvc"]
+    assert not (tmp_path / "raw.txt.dvc").exists()
+    with open(paths[1]) as f:
+        data = yaml.safe_load(f)
+    assert data["meta"]["computation"]["cmd"] == "process mid.txt"
+
+
+def test_write_all_dvc_uses_subclass_write_dvc(tmp_path, monkeypatch):
+    """The pooled path calls each artifact's own write_dvc override."""
+    import os
+
+    class Recording(Artifact):
+        written: list[str] = []
+
+        def write_dvc(self):
+            Recording.written.append(self.path)
+            return super().write_dvc()
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    a = Recording(path=str(tmp_path / "a.txt"), computation=Computation(cmd="make a"))
+    b = Recording(path=str(tmp_path / "b.txt"), computation=Computation(cmd="make b", deps=[a]))
+
+    assert write_all_dvc([b]) == [tmp_path / "a.txt.dvc", tmp_path / "b.txt.dvc"]
+    assert sorted(Recording.written) == [a.path, b.path]
+
+
 def test_artifact_exists(tmp_path):
     """Test Artifact.exists() method."""
     existing = tmp_path / "existing.txt"
@@ -143,10 +187,7 @@ def test_computation_get_dep_paths():
 
     paths = comp.get_dep_paths()
 
-    assert len(paths) == 3
-    assert Path("input1.txt") in paths
-    assert Path("input2.txt") in paths
-    assert Path("input3.txt") in paths
+    assert paths == [Path("input1.txt"), Path("input2.txt"), Path("input3.txt")]
 
 
 def test_computation_get_dep_hashes(tmp_path):
@@ -171,6 +212,31 @@ def test_computation_get_dep_hashes(tmp_path):
     assert len(hashes[str(dep_file)]) == 32  # MD5 hex digest length
 
 
+def test_computation_get_dep_hashes_parallel_keeps_order(tmp_path, monkeypatch):
+    """Deps hashed on a thread pool come back in dep order, same hashes."""
+    import dvx.run.hash as hash_mod
+    from dvx.run.hash import compute_md5
+
+    paths = []
+    for name in ["c.txt", "a.txt", "b.txt"]:
+        (tmp_path / name).write_text(f"{name}\n")
+        paths.append(tmp_path / name)
+    recorded = Artifact(path=str(tmp_path / "missing.txt"), md5="known_hash")
+    comp = Computation(cmd="cat", deps=[str(paths[0]), recorded, *map(str, paths[1:])])
+
+    monkeypatch.setattr(hash_mod, "_PARALLEL_HASH_MIN_BYTES", 0)
+    monkeypatch.setattr(hash_mod.os, "cpu_count", lambda: 4)
+    hashes = comp.get_dep_hashes()
+
+    assert list(hashes) == [str(paths[0]), str(tmp_path / "missing.txt"), *map(str, paths[1:])]
+    assert hashes == {
+        str(paths[0]): compute_md5(paths[0]),
+        str(tmp_path / "missing.txt"): "known_hash",
+        str(paths[1]): compute_md5(paths[1]),
+        str(paths[2]): compute_md5(paths[2]),
+    }
+
+
 def test_artifact_get_upstream():
     """Test Artifact.get_upstream() returns only Artifact deps."""
     dep1 = Artifact(path="input1.txt")
@@ -213,6 +279,29 @@ def test_artifact_walk_upstream():
     assert ancestors[2] == output
 
 
+def test_artifact_walk_upstream_diamond():
+    """A shared ancestor is visited once, before everything downstream of it."""
+    root = Artifact(path="root.txt")
+    left = Artifact(path="left.txt", computation=Computation(cmd="l", deps=[root]))
+    right = Artifact(path="right.txt", computation=Computation(cmd="r", deps=[root]))
+    top = Artifact(path="top.txt", computation=Computation(cmd="t", deps=[left, right]))
+
+    assert top.walk_upstream(prune_fresh=False) == [root, left, right, top]
+
+
+def test_artifact_walk_upstream_deep_chain():
+    """Chains deeper than the recursion limit are walked without recursing."""
+    import sys
+
+    artifact = Artifact(path="a0.txt")
+    chain = [artifact]
+    for i in range(1, sys.getrecursionlimit() + 100):
+        artifact = Artifact(path=f"a{i}.txt", computation=Computation(cmd=f"make {i}", deps=[artifact]))
+        chain.append(artifact)
+
+    assert artifact.walk_upstream(prune_fresh=False) == chain
+
+
 def test_delayed_decorator():
     """Test @delayed decorator marks functions."""
 
@@ -283,7 +372,7 @@ def test_artifact_from_dvc_with_git_deps(tmp_path):
         },
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     artifact = Artifact.from_dvc(tmp_path / "output.txt")
 
@@ -312,7 +401,7 @@ def test_artifact_from_dvc_side_effect(tmp_path):
         }
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     artifact = Artifact.from_dvc(tmp_path / "deploy")
 
@@ -338,7 +427,7 @@ def test_artifact_from_dvc_side_effect_subdirectory(tmp_path):
         }
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     artifact = Artifact.from_dvc(subdir / "deploy")
 
@@ -347,9 +436,9 @@ def test_artifact_from_dvc_side_effect_subdirectory(tmp_path):
     assert artifact.md5 is None
 
 
-def test_materialize_single(tmp_path):
+def test_materialize_single(tmp_path, monkeypatch):
     """Test materialize() runs a computation and updates the artifact."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     output = tmp_path / "result.txt"
     artifact = Artifact(
@@ -365,9 +454,9 @@ def test_materialize_single(tmp_path):
     assert computed[0].md5 is not None
 
 
-def test_materialize_skips_fresh(tmp_path):
+def test_materialize_skips_fresh(tmp_path, monkeypatch):
     """Test materialize() skips already-fresh artifacts (doesn't re-run cmd)."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     output = tmp_path / "result.txt"
     output.write_text("existing\n")
@@ -391,9 +480,9 @@ def test_materialize_skips_fresh(tmp_path):
     assert output.read_text() == "existing\n"
 
 
-def test_materialize_error_raises(tmp_path):
+def test_materialize_error_raises(tmp_path, monkeypatch):
     """Test materialize() raises on command failure."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     output = tmp_path / "result.txt"
     artifact = Artifact(
@@ -405,9 +494,9 @@ def test_materialize_error_raises(tmp_path):
         materialize([artifact], update_dvc=False)
 
 
-def test_walk_upstream_prunes_at_fresh(tmp_path):
+def test_walk_upstream_prunes_at_fresh(tmp_path, monkeypatch):
     """walk_upstream stops at fresh artifacts; further-upstream is not visited."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     from dvx.run.dvc_files import write_dvc_file
     from dvx.run.hash import compute_md5
@@ -460,9 +549,9 @@ def test_walk_upstream_prunes_at_fresh(tmp_path):
     assert [a.path for a in walked_full] == [str(leaf_path), str(mid_path), str(top_path)]
 
 
-def test_walk_upstream_prune_skips_missing_raw_dep(tmp_path):
+def test_walk_upstream_prune_skips_missing_raw_dep(tmp_path, monkeypatch):
     """A fresh chain stays prunable even when an ancestor's raw input is gone."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     from dvx.run.dvc_files import write_dvc_file
     from dvx.run.hash import compute_md5
@@ -514,14 +603,14 @@ def test_walk_upstream_prune_skips_missing_raw_dep(tmp_path):
     assert [a.path for a in walked] == [str(b_path)]
 
 
-def test_get_dep_hashes_recompute_falls_back_to_recorded(tmp_path):
+def test_get_dep_hashes_recompute_falls_back_to_recorded(tmp_path, monkeypatch):
     """recompute=True must not drop deps whose files aren't on disk locally.
 
     Reproduces the spec's bonus footgun: a no-op rebuild used to silently
     strip the deps map from the .dvc file when the upstream wasn't materialized
     locally (e.g. with --cached or pruned upstream).
     """
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Dep with a known md5 but no file on disk
     dep = Artifact(path=str(tmp_path / "missing.txt"), md5="recorded-md5")
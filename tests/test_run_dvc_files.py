@@ -16,6 +16,7 @@ from dvx.run.dvc_files import (
     read_dvc_file,
     write_dvc_file,
 )
+from tests.yaml_util import dump_yaml
 
 
 def test_write_dvc_file_basic(tmp_path):
@@ -39,6 +40,32 @@ def test_write_dvc_file_basic(tmp_path):
     assert data["outs"][0]["path"] == "output.txt"
 
 
+def test_write_dvc_file_placeholder(tmp_path, monkeypatch):
+    """Placeholder writes (no hash yet) are formatted without yaml.dump."""
+    import dvx.run.dvc_files as dvc_files_mod
+
+    def fail(*args, **kwargs):
+        raise AssertionError("placeholder write went through yaml.dump")
+
+    monkeypatch.setattr(dvc_files_mod.yaml, "dump", fail)
+    dvc_path = write_dvc_file(tmp_path / "output.txt")
+    assert dvc_path.read_text() == "outs:\n- hash: md5\n  path: output.txt\n"
+
+
+def test_write_dvc_file_unchanged_skips_write(tmp_path):
+    """Rewriting identical content leaves the file (and its mtime) alone."""
+    output_path = tmp_path / "output.txt"
+    dvc_path = write_dvc_file(output_path, md5="abc123", size=100)
+    os.utime(dvc_path, ns=(1_000_000_000, 1_000_000_000))
+
+    assert write_dvc_file(output_path, md5="abc123", size=100) == dvc_path
+    assert dvc_path.stat().st_mtime_ns == 1_000_000_000
+
+    write_dvc_file(output_path, md5="def456", size=100)
+    assert dvc_path.stat().st_mtime_ns != 1_000_000_000
+    assert yaml.safe_load(dvc_path.read_text())["outs"][0]["md5"] == "def456"
+
+
 def test_write_dvc_file_with_computation(tmp_path):
     """Test .dvc file writing with computation block."""
     output_path = tmp_path / "output.txt"
@@ -85,6 +112,44 @@ def test_write_dvc_file_directory(tmp_path):
     assert data["outs"][0]["nfiles"] == 2
 
 
+@pytest.mark.parametrize("cmd", [
+    "make",
+    "python process.py --in data.csv",  # spaces, fits on one line
+    "python process.py " + " ".join(f"in{i}.csv" for i in range(9)),  # wraps: fallback
+    "echo 'hi' > out",  # quotes: fallback
+    "... go",  # document-end marker: quoted
+    "true",  # would load as a bool if unquoted
+    # double-quoted and wrapped: libyaml would break the line differently
+    'python run.py --name "\u00e9"\n' + " ".join(f"--opt{i}=v" for i in range(12)),
+])
+@pytest.mark.parametrize("dep", ["data.csv", "2024-01-01", "a: b", "123"])
+def test_dump_dvc_yaml_matches_yaml_dump(cmd, dep):
+    """The direct .dvc writer produces exactly yaml.dump's output."""
+    from dvx.run.dvc_files import _dump_dvc_yaml
+
+    data = {
+        "outs": [{"md5": "abc123.dir", "size": 100, "hash": "md5", "nfiles": 2, "path": "out"}],
+        "meta": {"computation": {"cmd": cmd, "deps": {dep: "def456"}, "side_effect": True}},
+    }
+    expected = yaml.dump(data, sort_keys=False, default_flow_style=False)
+    assert _dump_dvc_yaml(data) == expected
+
+
+def test_write_dvc_file_directory_counts_nested_files(tmp_path):
+    """nfiles is counted recursively when not passed in."""
+    output_dir = tmp_path / "output_dir"
+    (output_dir / "a" / "b").mkdir(parents=True)
+    (output_dir / "top.txt").write_text("1")
+    (output_dir / "a" / "mid.txt").write_text("2")
+    (output_dir / "a" / "b" / "deep.txt").write_text("3")
+
+    dvc_path = write_dvc_file(output_path=output_dir, md5="abc123", size=3)
+
+    with open(dvc_path) as f:
+        data = yaml.safe_load(f)
+    assert data["outs"][0]["nfiles"] == 3
+
+
 def test_read_dvc_file_basic(tmp_path):
     """Test reading basic .dvc file."""
     dvc_file = tmp_path / "data.txt.dvc"
@@ -98,7 +163,7 @@ def test_read_dvc_file_basic(tmp_path):
         ]
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     info = read_dvc_file(tmp_path / "data.txt")
 
@@ -129,7 +194,7 @@ def test_read_dvc_file_with_computation(tmp_path):
         },
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     info = read_dvc_file(tmp_path / "output.txt")
 
@@ -152,7 +217,7 @@ def test_read_dvc_file_directory(tmp_path):
         ]
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     info = read_dvc_file(tmp_path / "data_dir")
 
@@ -181,7 +246,7 @@ def test_read_dvc_file_direct_path(tmp_path):
         ]
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     # Pass .dvc file path directly
     info = read_dvc_file(dvc_file)
@@ -190,6 +255,35 @@ def test_read_dvc_file_direct_path(tmp_path):
     assert info.md5 == "abc123"
 
 
+def test_read_dvc_file_memoized_by_mtime(tmp_path):
+    """Unchanged .dvc files are parsed once; a new mtime or size re-parses."""
+    output = tmp_path / "data.txt"
+    dvc_path = write_dvc_file(output_path=output, md5="abc123", size=100)
+    # Backdate past the "recently modified" window so the result is cached
+    os.utime(dvc_path, ns=(1_000_000_000, 1_000_000_000))
+
+    from dvx.run.dvc_files import _read_dvc_file_cached
+
+    _read_dvc_file_cached.cache_clear()
+    first = read_dvc_file(output)
+    assert read_dvc_file(output) == first
+    assert first.md5 == "abc123"
+    info = _read_dvc_file_cached.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+    write_dvc_file(output_path=output, md5="def456", size=100)
+    # Freshly written: bypasses the cache even before its mtime ages out
+    assert read_dvc_file(output).md5 == "def456"
+    os.utime(dvc_path, ns=(2_000_000_000, 2_000_000_000))
+    assert read_dvc_file(output).md5 == "def456"
+
+    # Same (old) mtime but different content, as an mtime-preserving copy
+    # leaves it: the size change still re-parses
+    write_dvc_file(output_path=output, md5="def456", size=100_000)
+    os.utime(dvc_path, ns=(2_000_000_000, 2_000_000_000))
+    assert read_dvc_file(output).size == 100_000
+
+
 def test_get_dvc_file_path():
     """Test get_dvc_file_path helper."""
     assert get_dvc_file_path(Path("data.txt")) == Path("data.txt.dvc")
@@ -252,7 +346,7 @@ def test_read_dvc_file_with_git_deps(tmp_path):
         },
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     info = read_dvc_file(tmp_path / "output.txt")
 
@@ -313,7 +407,7 @@ def test_read_dvc_file_no_git_deps(tmp_path):
         },
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     info = read_dvc_file(tmp_path / "output.txt")
 
@@ -337,7 +431,7 @@ def test_read_side_effect_dvc_file(tmp_path):
         }
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     info = read_dvc_file(dvc_file)
 
@@ -364,7 +458,7 @@ def test_read_side_effect_subdirectory_path(tmp_path):
         }
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     info = read_dvc_file(dvc_file)
     assert info is not None
@@ -377,7 +471,7 @@ def test_read_no_outs_no_computation_returns_none(tmp_path):
     dvc_file = tmp_path / "empty.dvc"
     dvc_content = {"meta": {"some_key": "value"}}
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     assert read_dvc_file(dvc_file) is None
 
@@ -405,6 +499,34 @@ def test_is_side_effect_property():
     assert explicit_false.is_side_effect is False
 
 
+def test_dvc_file_info_is_frozen():
+    """Memoized DVCFileInfo instances can't be modified in place."""
+    import dataclasses
+
+    info = DVCFileInfo(path="out.txt", md5="abc123")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        info.md5 = "def456"
+    assert not hasattr(info, "__dict__")
+
+
+def test_read_dvc_file_memo_hands_out_copies(tmp_path):
+    """Mutating a memoized read's containers doesn't leak into later reads."""
+    output = tmp_path / "out.txt"
+    dvc_path = write_dvc_file(output, md5="abc123", size=6, cmd="make", deps={"in.txt": "111"})
+    os.utime(dvc_path, ns=(1_000_000_000, 1_000_000_000))
+
+    info = read_dvc_file(output)
+    info.deps["in.txt"] = "corrupted"
+    info.git_deps["x"] = "y"
+    info.outs[0].md5 = "corrupted"
+    info.outs.clear()
+
+    again = read_dvc_file(output)
+    assert again.deps == {"in.txt": "111"}
+    assert again.git_deps == {}
+    assert [out.md5 for out in again.outs] == ["abc123"]
+
+
 def test_explicit_side_effect_roundtrip(tmp_path):
     """Test that explicit side_effect: true persists through write/read."""
     output_path = tmp_path / "deploy"
@@ -466,9 +588,9 @@ def test_side_effect_roundtrip(tmp_path):
     assert info.size is None
 
 
-def test_side_effect_freshness_deps_match(tmp_path):
+def test_side_effect_freshness_deps_match(tmp_path, monkeypatch):
     """Side-effect is fresh when all dep hashes match their .dvc files."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create a dep with matching .dvc
     dep_dvc = tmp_path / "dist.dvc"
@@ -476,7 +598,7 @@ def test_side_effect_freshness_deps_match(tmp_path):
         "outs": [{"md5": "abc123", "size": 100, "path": "dist"}]
     }
     with open(dep_dvc, "w") as f:
-        yaml.dump(dep_content, f)
+        dump_yaml(dep_content, f)
 
     # Create side-effect .dvc with matching dep hash
     se_dvc = tmp_path / "deploy.dvc"
@@ -489,16 +611,88 @@ def test_side_effect_freshness_deps_match(tmp_path):
         }
     }
     with open(se_dvc, "w") as f:
-        yaml.dump(se_content, f)
+        dump_yaml(se_content, f)
 
     fresh, reason = is_output_fresh(Path("deploy"), use_mtime_cache=False)
     assert fresh is True
     assert reason == "up-to-date"
 
 
-def test_side_effect_stale_when_dep_changed(tmp_path):
+def test_fresh_verdict_reused_until_inputs_touched(tmp_path, monkeypatch):
+    """A fresh verdict is recorded and reused while nothing it read has changed."""
+    import dvx.run.dvc_files as dvc_files_mod
+    from dvx.run.hash import compute_md5
+    from dvx.run.status import get_status_db
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "in.txt").write_text("input\n")
+    (tmp_path / "out.txt").write_text("output\n")
+    write_dvc_file(
+        Path("out.txt"),
+        md5=compute_md5(tmp_path / "out.txt"),
+        size=7,
+        cmd="make",
+        deps={"in.txt": compute_md5(tmp_path / "in.txt")},
+    )
+    for name in ("in.txt", "out.txt", "out.txt.dvc"):
+        os.utime(tmp_path / name, ns=(1_000_000_000, 1_000_000_000))
+
+    assert is_output_fresh(Path("out.txt")) == (True, "up-to-date")
+    assert get_status_db().get_fresh(tmp_path / "out.txt") is not None
+
+    def fail(*args, **kwargs):
+        raise AssertionError("output re-hashed despite recorded fresh state")
+
+    with monkeypatch.context() as m:
+        m.setattr(dvc_files_mod, "get_artifact_hash_cached", fail)
+        assert is_output_fresh(Path("out.txt")) == (True, "up-to-date")
+
+    # Touching a dep invalidates the recorded state
+    (tmp_path / "in.txt").write_text("changed\n")
+    os.utime(tmp_path / "in.txt", ns=(2_000_000_000, 2_000_000_000))
+    assert is_output_fresh(Path("out.txt")) == (False, "dep changed: in.txt")
+
+
+def test_fresh_verdict_cache_does_not_create_status_db(tmp_path, monkeypatch):
+    """A freshness query with no output to hash leaves .dvc/dvx.db uncreated."""
+    import dvx.run.status as status_mod
+    from dvx.run.hash import compute_md5
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(status_mod, "_default_db", None)
+    (tmp_path / "in.txt").write_text("input\n")
+    write_dvc_file(Path("deploy"), cmd="deploy.sh", deps={"in.txt": compute_md5(tmp_path / "in.txt")})
+    for name in ("in.txt", "deploy.dvc"):
+        os.utime(tmp_path / name, ns=(1_000_000_000, 1_000_000_000))
+
+    assert is_output_fresh(Path("deploy")) == (True, "up-to-date")
+    assert not (tmp_path / ".dvc").exists()
+    assert status_mod._default_db is None
+
+
+def test_many_raw_deps_hashed_in_order(tmp_path, monkeypatch):
+    """Raw deps hashed on the pool still report the first changed dep."""
+    from dvx.run.hash import compute_md5
+
+    monkeypatch.chdir(tmp_path)
+    deps = {}
+    for i in range(5):
+        (tmp_path / f"in{i}.txt").write_text(f"input {i}\n")
+        deps[f"in{i}.txt"] = compute_md5(tmp_path / f"in{i}.txt")
+    write_dvc_file(Path("deploy"), cmd="deploy.sh", deps=deps)
+
+    assert is_output_fresh(Path("deploy"), use_mtime_cache=False) == (True, "up-to-date")
+
+    for i in (3, 1):
+        (tmp_path / f"in{i}.txt").write_text("changed\n")
+    assert is_output_fresh(Path("deploy"), use_mtime_cache=False) == (False, "dep changed: in1.txt")
+    details = get_freshness_details(Path("deploy"), use_mtime_cache=False)
+    assert list(details.changed_deps) == ["in1.txt", "in3.txt"]
+
+
+def test_side_effect_stale_when_dep_changed(tmp_path, monkeypatch):
     """Side-effect is stale when a dep hash no longer matches."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create a dep with UPDATED hash
     dep_dvc = tmp_path / "dist.dvc"
@@ -506,7 +700,7 @@ def test_side_effect_stale_when_dep_changed(tmp_path):
         "outs": [{"md5": "new_hash_999", "size": 200, "path": "dist"}]
     }
     with open(dep_dvc, "w") as f:
-        yaml.dump(dep_content, f)
+        dump_yaml(dep_content, f)
 
     # Side-effect .dvc still references the OLD dep hash
     se_dvc = tmp_path / "deploy.dvc"
@@ -519,7 +713,7 @@ def test_side_effect_stale_when_dep_changed(tmp_path):
         }
     }
     with open(se_dvc, "w") as f:
-        yaml.dump(se_content, f)
+        dump_yaml(se_content, f)
 
     fresh, reason = is_output_fresh(Path("deploy"), use_mtime_cache=False)
     assert fresh is False
@@ -594,7 +788,7 @@ def test_read_fetch_schedule(tmp_path):
         },
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     info = read_dvc_file(dvc_file)
     assert info is not None
@@ -642,12 +836,12 @@ def test_fetch_schedule_roundtrip(tmp_path):
     assert info.fetch_last_run == "2026-04-07T15:10:00Z"
 
 
-def test_fetch_due_makes_output_stale(tmp_path):
+def test_fetch_due_makes_output_stale(tmp_path, monkeypatch):
     """Output with expired fetch schedule reports stale."""
     from datetime import datetime, timezone
     from unittest.mock import patch
 
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create output file
     output = tmp_path / "data.xml"
@@ -672,9 +866,9 @@ def test_fetch_due_makes_output_stale(tmp_path):
     assert reason == "fetch schedule due"
 
 
-def test_fetch_not_due_output_fresh(tmp_path):
+def test_fetch_not_due_output_fresh(tmp_path, monkeypatch):
     """Output with recent fetch schedule and matching hash is fresh."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create output file with known content
     output = tmp_path / "data.xml"
@@ -704,14 +898,12 @@ def test_fetch_not_due_output_fresh(tmp_path):
 
 
 @pytest.fixture
-def git_repo(tmp_path):
+def git_repo(tmp_path, monkeypatch):
     """Create a temporary git repo with files and directories."""
     import subprocess
 
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=tmp_path, capture_output=True, check=True)
-    subprocess.run(["git", "config", "user.name", "Test"], cwd=tmp_path, capture_output=True, check=True)
 
     # Create files
     (tmp_path / "script.py").write_text("print('hello')\n")
@@ -753,6 +945,54 @@ def test_get_git_object_sha_directory(git_repo):
     assert len(dir_sha) == 40
 
 
+def test_git_lookups_follow_moving_refs(git_repo):
+    """Tree listings are memoized per commit, so HEAD lookups see new commits."""
+    import subprocess
+
+    from dvx.run.dvc_files import (
+        _list_tree,
+        get_git_blob_sha,
+        get_git_head_sha,
+        has_file_changed_since,
+        invalidate_git_cache,
+    )
+
+    invalidate_git_cache()
+    head = get_git_head_sha(git_repo)
+    blob = get_git_blob_sha("script.py", "HEAD", git_repo)
+    assert get_git_blob_sha("script.py", head, git_repo) == blob
+    assert _list_tree.cache_info().currsize == 1
+    assert has_file_changed_since("script.py", head, git_repo) is False
+    assert has_file_changed_since("new.py", head, git_repo) is None
+
+    # A commit made outside dvx (e.g. by a stage command)
+    (git_repo / "script.py").write_text("print('bye')\n")
+    (git_repo / "new.py").write_text("x = 1\n")
+    subprocess.run(["git", "add", "."], cwd=git_repo, capture_output=True, check=True)
+    subprocess.run(["git", "commit", "-m", "edit"], cwd=git_repo, capture_output=True, check=True)
+
+    assert get_git_head_sha(git_repo) != head
+    assert get_git_blob_sha("script.py", "HEAD", git_repo) != blob
+    assert has_file_changed_since("script.py", head, git_repo) is True
+    assert has_file_changed_since("new.py", "HEAD", git_repo) is False
+
+
+def test_git_lookup_failures_not_memoized(git_repo):
+    """A ref that doesn't resolve yet isn't pinned as an empty tree."""
+    import subprocess
+
+    from dvx.run.dvc_files import _list_tree, get_git_blob_sha, invalidate_git_cache
+
+    invalidate_git_cache()
+    assert get_git_blob_sha("script.py", "feature", git_repo) is None
+    missing = "0" * 40
+    assert get_git_blob_sha("script.py", missing, git_repo) is None
+    assert _list_tree.cache_info().currsize == 0
+
+    subprocess.run(["git", "branch", "feature"], cwd=git_repo, capture_output=True, check=True)
+    assert get_git_blob_sha("script.py", "feature", git_repo) is not None
+
+
 def test_get_git_object_sha_trailing_slash(git_repo):
     """get_git_object_sha strips trailing slash."""
     from dvx.run.dvc_files import get_git_object_sha
@@ -763,13 +1003,13 @@ def test_get_git_object_sha_trailing_slash(git_repo):
     assert with_slash == without_slash
 
 
-def test_directory_git_dep_freshness(git_repo):
+def test_directory_git_dep_freshness(git_repo, monkeypatch):
     """Freshness check works with directory git_deps (tree SHAs)."""
     import subprocess
 
     from dvx.run.dvc_files import get_git_object_sha
 
-    os.chdir(git_repo)
+    monkeypatch.chdir(git_repo)
 
     # Get current tree SHA for src/
     tree_sha = get_git_object_sha("src", "HEAD", git_repo)
@@ -800,9 +1040,9 @@ def test_directory_git_dep_freshness(git_repo):
     subprocess.run(["git", "add", "src/app.ts"], cwd=git_repo, capture_output=True, check=True)
     subprocess.run(["git", "commit", "-m", "update app"], cwd=git_repo, capture_output=True, check=True)
 
-    # Clear blob cache so it re-reads
-    from dvx.run.dvc_files import _blob_cache
-    _blob_cache.clear()
+    # HEAD moved — drop memoized git lookups so it re-reads
+    from dvx.run.dvc_files import invalidate_git_cache
+    invalidate_git_cache()
 
     # Should now be stale — tree SHA changed
     fresh, reason = is_output_fresh(Path("bundle.js"), use_mtime_cache=False)
@@ -815,7 +1055,7 @@ def test_directory_git_dep_freshness(git_repo):
 # =============================================================================
 
 
-def test_file_git_dep_stale_when_worktree_edited_unstaged(git_repo):
+def test_file_git_dep_stale_when_worktree_edited_unstaged(git_repo, monkeypatch):
     """File git_dep edited in the worktree but not staged is detected as stale.
 
     Regression for the "build artifact, then commit" workflow: when a stage
@@ -825,7 +1065,7 @@ def test_file_git_dep_stale_when_worktree_edited_unstaged(git_repo):
     from dvx.run.dvc_files import get_git_dep_sha
     from dvx.run.hash import compute_md5
 
-    os.chdir(git_repo)
+    monkeypatch.chdir(git_repo)
 
     # Record current worktree SHA for script.py (= HEAD at this point).
     initial_sha = get_git_dep_sha("script.py")
@@ -853,7 +1093,7 @@ def test_file_git_dep_stale_when_worktree_edited_unstaged(git_repo):
     assert reason == "git dep changed: script.py"
 
 
-def test_file_git_dep_stale_when_worktree_edited_and_staged(git_repo):
+def test_file_git_dep_stale_when_worktree_edited_and_staged(git_repo, monkeypatch):
     """File git_dep staged but not committed is detected as stale.
 
     This is the exact failure mode in the path/hudcostreets pipeline: the
@@ -867,7 +1107,7 @@ def test_file_git_dep_stale_when_worktree_edited_and_staged(git_repo):
     from dvx.run.dvc_files import get_git_dep_sha
     from dvx.run.hash import compute_md5
 
-    os.chdir(git_repo)
+    monkeypatch.chdir(git_repo)
     initial_sha = get_git_dep_sha("script.py")
 
     output = git_repo / "out.txt"
@@ -889,7 +1129,7 @@ def test_file_git_dep_stale_when_worktree_edited_and_staged(git_repo):
     assert reason == "git dep changed: script.py"
 
 
-def test_file_git_dep_missing_when_worktree_file_deleted(git_repo):
+def test_file_git_dep_missing_when_worktree_file_deleted(git_repo, monkeypatch):
     """A git_dep whose file was deleted from the worktree is reported missing.
 
     Today's HEAD-based check considered the dep fresh as long as the file
@@ -899,7 +1139,7 @@ def test_file_git_dep_missing_when_worktree_file_deleted(git_repo):
     from dvx.run.dvc_files import get_git_dep_sha
     from dvx.run.hash import compute_md5
 
-    os.chdir(git_repo)
+    monkeypatch.chdir(git_repo)
     sha = get_git_dep_sha("script.py")
 
     output = git_repo / "out.txt"
@@ -952,17 +1192,17 @@ def test_get_git_dep_sha_directory_falls_back_to_head(git_repo):
 # =============================================================================
 
 
-def test_freshness_details_side_effect_fresh(tmp_path):
+def test_freshness_details_side_effect_fresh(tmp_path, monkeypatch):
     """get_freshness_details returns fresh for side-effect with matching deps."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     dep_dvc = tmp_path / "dist.dvc"
     with open(dep_dvc, "w") as f:
-        yaml.dump({"outs": [{"md5": "abc123", "size": 100, "path": "dist"}]}, f)
+        dump_yaml({"outs": [{"md5": "abc123", "size": 100, "path": "dist"}]}, f)
 
     se_dvc = tmp_path / "deploy.dvc"
     with open(se_dvc, "w") as f:
-        yaml.dump({
+        dump_yaml({
             "meta": {"computation": {"cmd": "deploy.sh", "deps": {"dist": "abc123"}}}
         }, f)
 
@@ -971,17 +1211,17 @@ def test_freshness_details_side_effect_fresh(tmp_path):
     assert details.reason == "up-to-date"
 
 
-def test_freshness_details_side_effect_stale(tmp_path):
+def test_freshness_details_side_effect_stale(tmp_path, monkeypatch):
     """get_freshness_details returns stale for side-effect with changed deps."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     dep_dvc = tmp_path / "dist.dvc"
     with open(dep_dvc, "w") as f:
-        yaml.dump({"outs": [{"md5": "new_hash", "size": 200, "path": "dist"}]}, f)
+        dump_yaml({"outs": [{"md5": "new_hash", "size": 200, "path": "dist"}]}, f)
 
     se_dvc = tmp_path / "deploy.dvc"
     with open(se_dvc, "w") as f:
-        yaml.dump({
+        dump_yaml({
             "meta": {"computation": {"cmd": "deploy.sh", "deps": {"dist": "old_hash"}}}
         }, f)
 
@@ -992,9 +1232,9 @@ def test_freshness_details_side_effect_stale(tmp_path):
     assert "dist" in details.changed_deps
 
 
-def test_freshness_details_fetch_due(tmp_path):
+def test_freshness_details_fetch_due(tmp_path, monkeypatch):
     """get_freshness_details returns stale when fetch schedule is due."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     output = tmp_path / "data.xml"
     output.write_text("<data/>")
@@ -1013,9 +1253,9 @@ def test_freshness_details_fetch_due(tmp_path):
     assert details.reason == "fetch schedule due"
 
 
-def test_freshness_details_fetch_not_due(tmp_path):
+def test_freshness_details_fetch_not_due(tmp_path, monkeypatch):
     """get_freshness_details returns fresh when fetch not due and hash matches."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     output = tmp_path / "data.xml"
     output.write_text("<data/>")
@@ -1080,7 +1320,7 @@ def test_find_parent_dvc_dir_basic(tmp_path):
         "outs": [{"md5": "abc123.dir", "size": 1000, "nfiles": 2, "path": "data"}]
     }
     with open(dvc_file, "w") as f:
-        yaml.dump(dvc_content, f)
+        dump_yaml(dvc_content, f)
 
     # Find parent for a file inside the directory
     result = find_parent_dvc_dir(tmp_path / "data" / "file1.txt")
@@ -1104,6 +1344,32 @@ def test_find_parent_dvc_dir_not_found(tmp_path):
     assert result is None
 
 
+def test_find_parent_dvc_dir_stops_at_repo_root(tmp_path):
+    """Tracked dirs above the git repo root aren't matched."""
+    repo = tmp_path / "outer" / "repo"
+    (repo / ".git").mkdir(parents=True)
+    (repo / "file.txt").write_text("hello\n")
+    write_dvc_file(tmp_path / "outer", md5="abc123", size=6, is_dir=True, nfiles=1)
+
+    assert find_parent_dvc_dir(repo / "file.txt") is None
+
+    # Without the repo boundary, the outer tracked dir is found
+    (repo / ".git").rmdir()
+    assert find_parent_dvc_dir(repo / "file.txt") == (tmp_path / "outer", "repo/file.txt")
+
+
+def test_find_parent_dvc_dir_sees_dvc_written_elsewhere(tmp_path):
+    """A .dvc file written outside write_dvc_file is picked up on the next lookup."""
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "file.txt").write_text("hello\n")
+
+    assert find_parent_dvc_dir(tmp_path / "data" / "file.txt") is None
+
+    (tmp_path / "data.dvc").write_text("outs:\n- md5: abc123.dir\n  hash: md5\n  path: data\n")
+    assert find_parent_dvc_dir(tmp_path / "data" / "file.txt") == (tmp_path / "data", "file.txt")
+
+
 def test_read_dir_manifest(tmp_path):
     """read_dir_manifest reads .dir JSON manifest from cache."""
     import json
@@ -1144,6 +1410,23 @@ def test_read_dir_manifest_with_dir_suffix(tmp_path):
     assert result == {"data.csv": "aaa"}
 
 
+def test_read_dir_manifest_cached_copy(tmp_path):
+    """read_dir_manifest parses each manifest once and returns fresh dicts."""
+    import json
+
+    from dvx.run.dvc_files import _read_dir_manifest_cached
+
+    cache_dir = tmp_path / "cache"
+    (cache_dir / "ab").mkdir(parents=True)
+    (cache_dir / "ab" / "c123.dir").write_text(json.dumps([{"md5": "aaa", "relpath": "data.csv"}]))
+
+    _read_dir_manifest_cached.cache_clear()
+    first = read_dir_manifest("abc123", cache_dir)
+    first["data.csv"] = "mutated"
+    assert read_dir_manifest("abc123.dir", cache_dir) == {"data.csv": "aaa"}
+    assert _read_dir_manifest_cached.cache_info().hits == 1
+
+
 def test_read_dir_manifest_missing(tmp_path):
     """read_dir_manifest returns empty dict for missing manifest."""
     cache_dir = tmp_path / "cache"
@@ -1258,9 +1541,9 @@ def test_relative_paths_roundtrip():
 # =============================================================================
 
 
-def test_raw_file_dep_stale_when_hash_differs(tmp_path):
+def test_raw_file_dep_stale_when_hash_differs(tmp_path, monkeypatch):
     """Dep on a raw file (no .dvc) is stale when recorded hash doesn't match."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create a raw dep file (no .dvc)
     dep = tmp_path / "input.txt"
@@ -1287,9 +1570,9 @@ def test_raw_file_dep_stale_when_hash_differs(tmp_path):
     assert "dep changed: input.txt" == reason
 
 
-def test_raw_file_dep_fresh_when_hash_matches(tmp_path):
+def test_raw_file_dep_fresh_when_hash_matches(tmp_path, monkeypatch):
     """Dep on a raw file (no .dvc) is fresh when recorded hash matches."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     dep = tmp_path / "input.txt"
     dep.write_text("content\n")
@@ -1313,9 +1596,9 @@ def test_raw_file_dep_fresh_when_hash_matches(tmp_path):
     assert fresh is True
 
 
-def test_raw_file_dep_freshness_details_stale(tmp_path):
+def test_raw_file_dep_freshness_details_stale(tmp_path, monkeypatch):
     """get_freshness_details reports changed raw file dep with actual hash."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     dep = tmp_path / "input.txt"
     dep.write_text("content\n")
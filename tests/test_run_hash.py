@@ -1,11 +1,19 @@
 """Tests for dvx.run.hash module."""
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from dvx.run.hash import compute_file_size, compute_md5
+from dvx.run.hash import (
+    clear_md5_cache,
+    compute_file_size,
+    compute_md5,
+    compute_md5_cached,
+    compute_md5_many,
+    compute_path_stats,
+)
 
 
 def test_compute_md5_file(tmp_path):
@@ -103,3 +111,91 @@ def test_compute_file_size_nested_directory(tmp_path):
     (nested / "nested.txt").write_text("world")  # 5 bytes
 
     assert compute_file_size(subdir) == 10
+
+
+def test_compute_path_stats_matches_separate_walks(tmp_path):
+    """One-walk stats agree with compute_md5 + compute_file_size."""
+    subdir = tmp_path / "parent"
+    (subdir / "child").mkdir(parents=True)
+    (subdir / "file.txt").write_text("hello")
+    (subdir / "child" / "nested.txt").write_text("world!")
+
+    stats = compute_path_stats(subdir)
+    assert (stats.md5, stats.size, stats.nfiles) == (compute_md5(subdir), 11, 2)
+
+    file_stats = compute_path_stats(subdir / "file.txt")
+    assert (file_stats.md5, file_stats.size, file_stats.nfiles) == (
+        compute_md5(subdir / "file.txt"), 5, None,
+    )
+
+
+def test_compute_md5_directory_parallel_matches_sequential(tmp_path, monkeypatch):
+    """Hashing files on a thread pool yields the same directory hash."""
+    import dvx.run.hash as hash_mod
+
+    subdir = tmp_path / "mydir"
+    (subdir / "sub").mkdir(parents=True)
+    for i in range(8):
+        (subdir / f"f{i}.txt").write_text(f"file {i}\n")
+        (subdir / "sub" / f"g{i}.txt").write_text(f"nested {i}\n")
+
+    sequential = compute_md5(subdir)
+    monkeypatch.setattr(hash_mod, "_PARALLEL_HASH_MIN_BYTES", 0)
+    monkeypatch.setattr(hash_mod.os, "cpu_count", lambda: 4)
+    assert compute_md5(subdir) == sequential
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_compute_md5_many_return_exceptions(tmp_path, monkeypatch, parallel):
+    """Unhashable paths yield their errors in place, sequentially or on a pool."""
+    import dvx.run.hash as hash_mod
+
+    if parallel:
+        monkeypatch.setattr(hash_mod, "_PARALLEL_HASH_MIN_BYTES", 0)
+        monkeypatch.setattr(hash_mod.os, "cpu_count", lambda: 4)
+    a = tmp_path / "a.txt"
+    a.write_text("a\n")
+    missing = tmp_path / "missing.txt"
+
+    with pytest.raises(FileNotFoundError):
+        compute_md5_many([a, missing])
+    md5, err = compute_md5_many([a, missing], return_exceptions=True)
+    assert md5 == compute_md5(a)
+    assert isinstance(err, FileNotFoundError)
+
+
+@pytest.mark.parametrize("size", [0, 100, 64 * 1024 - 1, 64 * 1024, 200_000])
+def test_compute_md5_file_sizes(tmp_path, size):
+    """Whole-read (small) and streamed (large) files hash like hashlib."""
+    import hashlib
+
+    data = bytes(range(256)) * (size // 256) + bytes(size % 256)
+    test_file = tmp_path / "data.bin"
+    test_file.write_bytes(data)
+    assert compute_md5(test_file) == hashlib.md5(data).hexdigest()
+
+
+def test_compute_md5_cached_memoized_across_path_spellings(tmp_path, monkeypatch):
+    """A file is hashed once per version, however its path is spelled."""
+    from dvx.run.hash import _md5_memo
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "sub").mkdir()
+    dep = tmp_path / "process.py"
+    dep.write_text("print('x')\n")
+    os.utime(dep, ns=(1_000_000_000, 1_000_000_000))
+
+    clear_md5_cache()
+    assert compute_md5_cached(Path("process.py")) == compute_md5(dep)
+    assert compute_md5_cached(Path("sub/../process.py")) == compute_md5(dep)
+    assert compute_path_stats(dep).md5 == compute_md5(dep)
+    info = _md5_memo.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+    # Freshly modified: bypasses the memo, sees the new content
+    dep.write_text("print('y')\n")
+    assert compute_md5_cached(dep) == compute_md5(dep)
+    assert _md5_memo.cache_info().currsize == 1
+
+    clear_md5_cache()
+    assert _md5_memo.cache_info().currsize == 0
@@ -8,6 +8,7 @@ the executor tries ``repo.pull(targets=[<dvc>])`` first and skips if the
 remote has the bit-identical output.
 """
 
+import re
 import subprocess
 from pathlib import Path
 
@@ -18,28 +19,15 @@ from click.testing import CliRunner
 from dvx.cli import cli
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
     return CliRunner()
 
 
 @pytest.fixture
-def repo_with_remote(tmp_path, monkeypatch):
+def repo_with_remote(git_dvc_repo_with_remote, monkeypatch):
     """DVC+git repo with a local remote at ``remote/``."""
-    repo = tmp_path / "repo"
-    remote = tmp_path / "remote"
-    repo.mkdir()
-    remote.mkdir()
-    for cmd in (
-        ["git", "init", "-b", "main"],
-        ["git", "config", "user.email", "t@t"],
-        ["git", "config", "user.name", "t"],
-        ["dvc", "init"],
-        ["dvc", "remote", "add", "-d", "local", str(remote)],
-        ["git", "add", "."],
-        ["git", "commit", "-m", "init"],
-    ):
-        subprocess.run(cmd, cwd=repo, check=True, capture_output=True)
+    repo, remote = git_dvc_repo_with_remote
     monkeypatch.chdir(repo)
     return repo, remote
 
@@ -47,7 +35,7 @@ def repo_with_remote(tmp_path, monkeypatch):
 def _write_stage(repo: Path, name: str, cmd: str) -> Path:
     dvc_path = repo / f"{name}.dvc"
     with open(dvc_path, "w") as f:
-        yaml.dump({"outs": [{"path": name}], "meta": {"computation": {"cmd": cmd}}}, f)
+        f.write(yaml.dump({"outs": [{"path": name}], "meta": {"computation": {"cmd": cmd}}}))
     return dvc_path
 
 
@@ -71,10 +59,17 @@ def _summary_line(output: str, key: str) -> int:
     raise AssertionError(f"no {key!r} line in:\n{output}")
 
 
+_ELAPSED_RE = re.compile(r"\(\d+\.\ds\)$")
+
+
 def _stage_status_lines(output: str) -> list[str]:
-    """Stage status lines from `dvx run` output (lines starting with two-space + glyph)."""
+    """Stage status lines from `dvx run` output (lines starting with two-space + glyph).
+
+    Elapsed times (``completed (0.0s)``) are wall-clock and vary under load
+    (e.g. ``pytest -n auto``), so they're normalized to ``(Ns)``.
+    """
     return [
-        line for line in output.split("\n")
+        _ELAPSED_RE.sub("(Ns)", line) for line in output.split("\n")
         if any(line.startswith(f"  {g}") for g in ("⟳", "✓", "✗", "◐", "○"))
     ]
 
@@ -122,7 +117,7 @@ def test_no_pull_deps_reruns_when_output_missing(runner, repo_with_remote):
 
     assert _stage_status_lines(result.output) == [
         "  ⟳ out.txt: running...",
-        "  ✓ out.txt: completed (0.0s)",
+        "  ✓ out.txt: completed (Ns)",
     ]
     assert _summary_line(result.output, "Executed") == 1
     assert _summary_line(result.output, "Skipped") == 0
@@ -149,7 +144,7 @@ def test_pull_deps_falls_through_when_remote_missing_blob(runner, repo_with_remo
 
     assert _stage_status_lines(result.output) == [
         "  ⟳ out.txt: running...",
-        "  ✓ out.txt: completed (0.0s)",
+        "  ✓ out.txt: completed (Ns)",
     ]
     assert _summary_line(result.output, "Executed") == 1
     assert (repo / "out.txt").read_text() == "v1\n"
@@ -170,6 +165,6 @@ def test_pull_deps_does_not_interfere_with_forced_rerun(runner, repo_with_remote
     assert result.exit_code == 0, result.output
     assert _stage_status_lines(result.output) == [
         "  ⟳ out.txt: running...",
-        "  ✓ out.txt: completed (0.0s)",
+        "  ✓ out.txt: completed (Ns)",
     ]
     assert _summary_line(result.output, "Executed") == 1
@@ -21,30 +21,15 @@ from dvx.cli import cli
 from dvx.run.hash import compute_md5
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
     return CliRunner()
 
 
 @pytest.fixture
-def repo_with_remote(tmp_path, monkeypatch):
+def repo_with_remote(git_dvc_repo_with_remote, monkeypatch):
     """DVC+git repo with a local remote at ``remote/``."""
-    repo = tmp_path / "repo"
-    remote = tmp_path / "remote"
-    repo.mkdir()
-    remote.mkdir()
-
-    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.email", "t@t"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.name", "t"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["dvc", "init"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(
-        ["dvc", "remote", "add", "-d", "local", str(remote)],
-        cwd=repo, check=True, capture_output=True,
-    )
-    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "init"], cwd=repo, check=True, capture_output=True)
-
+    repo, remote = git_dvc_repo_with_remote
     monkeypatch.chdir(repo)
     return repo, remote
 
@@ -53,7 +38,7 @@ def _write_stage(repo: Path, name: str, cmd: str) -> Path:
     """Write a .dvc file with a cmd that produces ``name``. Returns dvc path."""
     dvc_path = repo / f"{name}.dvc"
     with open(dvc_path, "w") as f:
-        yaml.dump({"outs": [{"path": name}], "meta": {"computation": {"cmd": cmd}}}, f)
+        f.write(yaml.dump({"outs": [{"path": name}], "meta": {"computation": {"cmd": cmd}}}))
     return dvc_path
 
 
@@ -26,14 +26,6 @@ pytestmark = pytest.mark.skipif(
 def dvc_repo(tmp_path):
     """Create a temporary git+dvc repo."""
     subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=tmp_path, capture_output=True, check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=tmp_path, capture_output=True, check=True,
-    )
     subprocess.run(["dvc", "init"], cwd=tmp_path, capture_output=True, check=True)
     return tmp_path
 
@@ -7,6 +7,7 @@ exact equality / counts. Avoid bare ``in result.output`` checks.
 
 import os
 import re
+import shutil
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -107,107 +108,94 @@ def parse_transfer(output: str) -> TransferResult:
     return r
 
 
-@pytest.fixture
+def _count_files(root: Path) -> int:
+    """Number of files under ``root`` (0 if it doesn't exist), via ``os.scandir``."""
+    count = 0
+    pending = [root]
+    while pending:
+        try:
+            it = os.scandir(pending.pop())
+        except FileNotFoundError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    count += 1
+    return count
+
+
+@pytest.fixture(scope="session")
 def runner():
     """Create a Click CLI test runner."""
     return CliRunner()
 
 
-@pytest.fixture
-def dvc_repo_with_remote(tmp_path):
-    """Create a temporary DVC repository with a local remote.
+@pytest.fixture(scope="session")
+def _dvc_repo_template(tmp_path_factory, _git_dvc_remote_template):
+    """A DVC repo with some tracked files, built once per session.
+
+    Its remote is ``../../remote`` (relative to ``.dvc/``), so each copy made
+    by ``dvc_repo_with_files`` pushes to its own sibling ``remote/``.
 
     Returns:
-        tuple: (repo_path, remote_path) - paths to repo and remote storage
+        tuple: (repo_path, files) - template repo path and list of tracked file names
     """
-    repo_path = tmp_path / "repo"
-    remote_path = tmp_path / "remote"
-    repo_path.mkdir()
-    remote_path.mkdir()
-
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
-
-    # Initialize DVC
-    subprocess.run(["dvc", "init"], cwd=repo_path, capture_output=True, check=True)
+    # Start from the committed git + DVC repo (with that remote)
+    repo_path = tmp_path_factory.mktemp("dvc_repo_with_files") / "repo"
+    shutil.copytree(_git_dvc_remote_template, repo_path, symlinks=True)
 
-    # Add local remote
+    # Create test files, then track them with one `dvc add`
+    files = []
+    for name, content in [
+        ("small.txt", "hello world"),
+        ("medium.txt", "x" * 1000),
+        ("large.txt", "y" * 10000),
+    ]:
+        (repo_path / name).write_text(content)
+        files.append(name)
     subprocess.run(
-        ["dvc", "remote", "add", "-d", "local", str(remote_path)],
+        ["dvc", "add", *files],
         cwd=repo_path,
         capture_output=True,
         check=True,
     )
 
-    # Commit DVC init
+    # Commit .dvc files
     subprocess.run(["git", "add", "."], cwd=repo_path, capture_output=True, check=True)
     subprocess.run(
-        ["git", "commit", "-m", "init"],
+        ["git", "commit", "-m", "add files"],
         cwd=repo_path,
         capture_output=True,
         check=True,
     )
 
-    return repo_path, remote_path
+    return repo_path, files
 
 
 @pytest.fixture
-def dvc_repo_with_files(dvc_repo_with_remote):
-    """Create a DVC repo with some tracked files.
+def dvc_repo_with_files(_dvc_repo_template, tmp_path):
+    """Create a DVC repo with some tracked files and an empty local remote.
 
     Returns:
         tuple: (repo_path, remote_path, files) - paths and list of tracked file names
     """
-    repo_path, remote_path = dvc_repo_with_remote
-
-    # Create and track test files
-    files = []
-    for name, content, size in [
-        ("small.txt", "hello world", 11),
-        ("medium.txt", "x" * 1000, 1000),
-        ("large.txt", "y" * 10000, 10000),
-    ]:
-        file_path = repo_path / name
-        file_path.write_text(content)
-        subprocess.run(
-            ["dvc", "add", name],
-            cwd=repo_path,
-            capture_output=True,
-            check=True,
-        )
-        files.append(name)
-
-    # Commit .dvc files
-    subprocess.run(["git", "add", "."], cwd=repo_path, capture_output=True, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "add files"],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
-
-    return repo_path, remote_path, files
+    template_path, files = _dvc_repo_template
+    repo_path = tmp_path / "repo"
+    remote_path = tmp_path / "remote"
+    shutil.copytree(template_path, repo_path, symlinks=True)
+    remote_path.mkdir()
+    return repo_path, remote_path, list(files)
 
 
 class TestPushDryRun:
     """Tests for dvx push --dry-run."""
 
-    def test_push_dry_run_shows_files_to_push(self, runner, dvc_repo_with_files):
+    def test_push_dry_run_shows_files_to_push(self, runner, dvc_repo_with_files, monkeypatch):
         """Test that dry-run shows files that would be pushed."""
         repo_path, _remote_path, files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         result = runner.invoke(cli, ["push", "-n"])
         assert result.exit_code == 0
@@ -221,10 +209,10 @@ class TestPushDryRun:
         listed_paths = {Path(f.path).name for f in parsed.would_files}
         assert listed_paths == set(files)
 
-    def test_push_dry_run_nothing_to_push(self, runner, dvc_repo_with_files):
+    def test_push_dry_run_nothing_to_push(self, runner, dvc_repo_with_files, monkeypatch):
         """Test dry-run after files are already pushed."""
         repo_path, _remote_path, files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         # Actually push first
         subprocess.run(["dvc", "push"], cwd=repo_path, capture_output=True, check=True)
@@ -239,10 +227,10 @@ class TestPushDryRun:
         assert parsed.would_files == []
         assert parsed.already_count == len(files)
 
-    def test_push_dry_run_specific_target(self, runner, dvc_repo_with_files):
+    def test_push_dry_run_specific_target(self, runner, dvc_repo_with_files, monkeypatch):
         """Test dry-run with specific target."""
         repo_path, _remote_path, _files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         result = runner.invoke(cli, ["push", "-n", "small.txt"])
         assert result.exit_code == 0
@@ -255,10 +243,10 @@ class TestPushDryRun:
 class TestPullDryRun:
     """Tests for dvx pull --dry-run."""
 
-    def test_pull_dry_run_nothing_to_pull(self, runner, dvc_repo_with_files):
+    def test_pull_dry_run_nothing_to_pull(self, runner, dvc_repo_with_files, monkeypatch):
         """Test dry-run when all files are already cached locally."""
         repo_path, _remote_path, files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         result = runner.invoke(cli, ["pull", "-n"])
         assert result.exit_code == 0
@@ -269,15 +257,14 @@ class TestPullDryRun:
         assert parsed.would_files == []
         assert parsed.already_count == len(files)
 
-    def test_pull_dry_run_shows_missing_files(self, runner, dvc_repo_with_files):
+    def test_pull_dry_run_shows_missing_files(self, runner, dvc_repo_with_files, monkeypatch):
         """Test dry-run shows files that need to be pulled."""
         repo_path, _remote_path, files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         subprocess.run(["dvc", "push"], cwd=repo_path, capture_output=True, check=True)
         cache_dir = repo_path / ".dvc" / "cache"
         if cache_dir.exists():
-            import shutil
             shutil.rmtree(cache_dir)
 
         result = runner.invoke(cli, ["pull", "-n"])
@@ -288,15 +275,14 @@ class TestPullDryRun:
         assert parsed.nothing is False
         assert {Path(f.path).name for f in parsed.would_files} == set(files)
 
-    def test_pull_dry_run_specific_target(self, runner, dvc_repo_with_files):
+    def test_pull_dry_run_specific_target(self, runner, dvc_repo_with_files, monkeypatch):
         """Test dry-run with specific target after clearing cache."""
         repo_path, _remote_path, _files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         subprocess.run(["dvc", "push"], cwd=repo_path, capture_output=True, check=True)
         cache_dir = repo_path / ".dvc" / "cache"
         if cache_dir.exists():
-            import shutil
             shutil.rmtree(cache_dir)
 
         result = runner.invoke(cli, ["pull", "-n", "small.txt"])
@@ -310,15 +296,14 @@ class TestPullDryRun:
 class TestTargetedPull:
     """Tests for dvx pull <target> (targeted pull via .dvc file resolution)."""
 
-    def test_pull_specific_file(self, runner, dvc_repo_with_files):
+    def test_pull_specific_file(self, runner, dvc_repo_with_files, monkeypatch):
         """Test pulling a specific file by output path."""
         repo_path, remote_path, files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         # Push to remote, then remove the output file and clear cache
         subprocess.run(["dvc", "push"], cwd=repo_path, capture_output=True, check=True)
         (repo_path / "small.txt").unlink()
-        import shutil
         cache_dir = repo_path / ".dvc" / "cache"
         if cache_dir.exists():
             shutil.rmtree(cache_dir)
@@ -332,14 +317,13 @@ class TestTargetedPull:
         assert (repo_path / "small.txt").exists()
         assert (repo_path / "small.txt").read_text() == "hello world"
 
-    def test_pull_by_dvc_path(self, runner, dvc_repo_with_files):
+    def test_pull_by_dvc_path(self, runner, dvc_repo_with_files, monkeypatch):
         """Test pulling by .dvc file path."""
         repo_path, remote_path, files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         subprocess.run(["dvc", "push"], cwd=repo_path, capture_output=True, check=True)
         (repo_path / "small.txt").unlink()
-        import shutil
         cache_dir = repo_path / ".dvc" / "cache"
         if cache_dir.exists():
             shutil.rmtree(cache_dir)
@@ -348,10 +332,10 @@ class TestTargetedPull:
         assert result.exit_code == 0
         assert (repo_path / "small.txt").exists()
 
-    def test_pull_nonexistent_target(self, runner, dvc_repo_with_files):
+    def test_pull_nonexistent_target(self, runner, dvc_repo_with_files, monkeypatch):
         """Test pulling a target with no .dvc file."""
         repo_path, _remote_path, _files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         result = runner.invoke(cli, ["pull", "nonexistent.txt"])
         # Resolver emits a warning, then reports "Nothing to pull." since
@@ -362,16 +346,16 @@ class TestTargetedPull:
         assert parsed.fetched is None
         assert parsed.pushed is None
 
-    def test_pull_already_up_to_date(self, runner, dvc_repo_with_files):
+    def test_pull_already_up_to_date(self, runner, dvc_repo_with_files, monkeypatch):
         """Test pulling when file already matches cache."""
         repo_path, remote_path, files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         # File already exists and matches — should be a no-op
         result = runner.invoke(cli, ["pull", "small.txt"])
         assert result.exit_code == 0
 
-    def test_pull_glob_expands_pattern(self, runner, dvc_repo_with_files):
+    def test_pull_glob_expands_pattern(self, runner, dvc_repo_with_files, monkeypatch):
         """`dvx pull --glob '<pattern>' <target>` must expand the pattern.
 
         Regression: introduced in 65f993aa8 ("Fix targeted dvx pull for .dvc
@@ -380,13 +364,12 @@ class TestTargetedPull:
         passed to DVC as a path target → "<pattern> does not exist".
         """
         repo_path, _remote_path, _files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         # Push to remote, remove outputs + clear cache so a real pull is needed
         subprocess.run(["dvc", "push"], cwd=repo_path, capture_output=True, check=True)
         for name in ("small.txt", "medium.txt", "large.txt"):
             (repo_path / name).unlink()
-        import shutil
         cache_dir = repo_path / ".dvc" / "cache"
         if cache_dir.exists():
             shutil.rmtree(cache_dir)
@@ -408,34 +391,30 @@ class TestTargetedPull:
 class TestDryRunDoesNotTransfer:
     """Tests to verify dry-run doesn't actually transfer files."""
 
-    def test_push_dry_run_does_not_push(self, runner, dvc_repo_with_files):
+    def test_push_dry_run_does_not_push(self, runner, dvc_repo_with_files, monkeypatch):
         """Verify dry-run doesn't actually push files."""
         repo_path, remote_path, files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         # Remote should be empty initially
-        remote_files = list(remote_path.rglob("*"))
-        initial_count = len([f for f in remote_files if f.is_file()])
+        initial_count = _count_files(remote_path)
 
         # Run dry-run
         result = runner.invoke(cli, ["push", "-n"])
         assert result.exit_code == 0
 
         # Remote should still be empty
-        remote_files = list(remote_path.rglob("*"))
-        final_count = len([f for f in remote_files if f.is_file()])
-        assert final_count == initial_count
+        assert _count_files(remote_path) == initial_count
 
-    def test_pull_dry_run_does_not_pull(self, runner, dvc_repo_with_files):
+    def test_pull_dry_run_does_not_pull(self, runner, dvc_repo_with_files, monkeypatch):
         """Verify dry-run doesn't actually pull files."""
         repo_path, remote_path, files = dvc_repo_with_files
-        os.chdir(repo_path)
+        monkeypatch.chdir(repo_path)
 
         # Push and clear cache
         subprocess.run(["dvc", "push"], cwd=repo_path, capture_output=True, check=True)
         cache_dir = repo_path / ".dvc" / "cache"
         if cache_dir.exists():
-            import shutil
             shutil.rmtree(cache_dir)
 
         # Cache should be empty
@@ -446,6 +425,4 @@ class TestDryRunDoesNotTransfer:
         assert result.exit_code == 0
 
         # Cache should still be empty (or only have the structure, not files)
-        cache_files = list(cache_dir.rglob("*")) if cache_dir.exists() else []
-        file_count = len([f for f in cache_files if f.is_file()])
-        assert file_count == 0
+        assert _count_files(cache_dir) == 0
@@ -0,0 +1,14 @@
+"""YAML writing for test fixtures.
+
+Fixtures write .dvc files through libyaml's dumper when PyYAML has it (the
+pure-Python emitter dominates fixture setup), as ``dvx.run.dvc_files`` does.
+"""
+
+import yaml
+
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def dump_yaml(obj, f) -> None:
+    """``yaml.dump(obj, f)``, serialized first and written once."""
+    f.write(yaml.dump(obj, Dumper=YAML_DUMPER))